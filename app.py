@@ -2,19 +2,37 @@
 FastAPI Microservice for Personal Astrological Calendar
 Transforms the interactive astro_calendar_personal_v3 into a REST API service.
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-import uvicorn
+import logging
 import os
+import time
 from datetime import datetime
 from src.api.routes.calendar import router as calendar_router
 from src.api.routes.cycles import router as cycles_router
 from src.api.schemas import HealthResponse, InfoResponse
 
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set the ephemeris path and page in the .se1 files before the first request."""
+    from src.core.ephemeris import preload_ephemeris, warm_up_ephemeris
+    preload_ephemeris()
+    # Set WARMUP=0 to skip the segment warm-up (e.g. for fast local reloads);
+    # WARMUP_YEARS sets how many years it covers (default 30)
+    if os.getenv("WARMUP", "1") == "1":
+        start = time.perf_counter()
+        count = warm_up_ephemeris(years=int(os.getenv("WARMUP_YEARS", "30")))
+        logger.info("Swiss Ephemeris warm: %d body-jds in %.2fs", count, time.perf_counter() - start)
+    yield
+
 app = FastAPI(
     title="Personal Astrology Calendar API",
     description="Complete microservice for calculating personal astrological events: transits, lunar phases, eclipses, progressed moon, and profections",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware for frontend integration
@@ -26,16 +44,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Include the calendar router
+# Include the calendar router (the routes import their services lazily)
 app.include_router(calendar_router)
 app.include_router(cycles_router)
 
+# Last formatted health timestamp: [monotonic time, isoformat string]
+_health_timestamp = [float("-inf"), ""]
+
+def _health_now() -> str:
+    """Current timestamp for /health, reformatted at most every 100ms."""
+    now = time.monotonic()
+    if now - _health_timestamp[0] > 0.1:
+        _health_timestamp[:] = [now, datetime.now().isoformat()]
+    return _health_timestamp[1]
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
     return HealthResponse(
         status="healthy",
-        timestamp=datetime.now().isoformat(),
+        timestamp=_health_now(),
         version="2.0.0",
         commit_sha=os.getenv("COMMIT_SHA")
     )
@@ -81,4 +109,5 @@ async def root():
     }
 
 if __name__ == "__main__":
+    import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8004)
@@ -1,9 +1,13 @@
 
+import sys
 import swisseph as swe
 from datetime import datetime
 from zoneinfo import ZoneInfo
+import numpy as np
 import pytz
 
+from src.utils.swe_batch import calc_bodies
+
 # Setup Swisseph (Moshier fallback)
 swe.set_ephe_path('')
 
@@ -30,20 +34,20 @@ def calculate_natal():
     # SUN=0...PLUTO=9
     planet_names = ["Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"]
     
-    print("\nNATAL_DATA = {")
-    print('    "name": "Maria Blaquier (Real)",')
-    print('    "points": {')
+    # We need Topocentric positions for exactness? Usually Geocentric is standard for charts.
+    # Let's stick to standard Geocentric (swe.calc_ut) as POC does.
+    # If user wants Topo, we need to set topo.
+    lons = calc_bodies(jd, np.arange(10), swe.FLG_MOSEPH)[:, 0]
     
-    for i, name in enumerate(planet_names):
-        # We need Topocentric positions for exactness? Usually Geocentric is standard for charts.
-        # Let's stick to standard Geocentric (swe.calc_ut) as POC does.
-        # If user wants Topo, we need to set topo.
-        res = swe.calc_ut(jd, i, swe.FLG_MOSEPH)
-        lon_deg = res[0][0]
-        print(f'        "{name}": {{"longitude": {lon_deg:.6f}}},')
-        
-    print('    }')
-    print("}")
+    lines = [
+        "",
+        "NATAL_DATA = {",
+        '    "name": "Maria Blaquier (Real)",',
+        '    "points": {',
+    ]
+    lines += [f'        "{name}": {{"longitude": {lon_deg:.6f}}},' for name, lon_deg in zip(planet_names, lons)]
+    lines += ['    }', '}']
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     calculate_natal()
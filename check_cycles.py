@@ -1,15 +1,13 @@
 import swisseph as swe
-import pytz
-from datetime import datetime, timedelta
-import ephem
-
-def julian_day(dt):
-    if dt.tzinfo:
-        dt = dt.astimezone(pytz.UTC)
-    return swe.julday(dt.year, dt.month, dt.day, dt.hour + dt.minute/60.0 + dt.second/3600.0)
-
-def fmt_pos(deg):
-    return f"Virgo {deg:.2f}°"
+import numpy as np
+from datetime import datetime
+from src.utils.swe_batch import calc_many
+from src.utils.time_utils import jds_from_dt64
+from src.utils.math_utils import fmt_sign
+from src.utils.lunation_sweep import (
+    find_lunations, next_lunation, jd_to_datetime,
+    NEW_MOON, FIRST_QUARTER, LAST_QUARTER
+)
 
 def check_cycles():
     # Natal Positions
@@ -23,62 +21,59 @@ def check_cycles():
     # 1. Verify Event 1: June 3, 2025 (First Quarter)
     # User says: 12° 50' Virgo (162.83°)
     d1 = datetime(2025, 6, 3, 0, 40) # Local time? Or UTC? User says "00:40". Check UTC.
-    # Ephem usually gives UTC. Let's find exact FQ.
+    # Lunations are computed in UTC. Let's find exact FQ.
+    
+    # Sweep bounds and search anchors (UTC) converted in one pass
+    jd_start, jd_end, jd_jun25, jd_aug24, jd_dec25 = jds_from_dt64(np.array(
+        ['2023-09-10', '2026-01-01', '2025-06-01', '2024-08-25', '2025-12-01'],
+        dtype='datetime64[ns]'
+    ))
+    
+    # All lunations from Sep 2023 to Dec 2025 in a single sweep
+    lunations = find_lunations(jd_start, jd_end)
+    
+    jd_fq = next_lunation(lunations, FIRST_QUARTER, jd_jun25)
+    
+    # New Moon should be ~ Sept 2024
+    jd_nm = next_lunation(lunations, NEW_MOON, jd_aug24)
+    
+    jd_lq = next_lunation(lunations, LAST_QUARTER, jd_dec25)
     
-    start_jun = ephem.Date("2025/6/1")
-    fq_date = ephem.next_first_quarter_moon(start_jun)
-    dt_fq = ephem.Date(fq_date).datetime().replace(tzinfo=pytz.UTC)
+    # Sequence: NM (Sep 23) -> FQ (Jun 24) -> FM (Mar 25) -> LQ (Dec 25)
+    jd_nm_2 = next_lunation(lunations, NEW_MOON, jd_start)
+    
+    dt_fq, dt_nm, dt_lq, dt_nm_2 = (jd_to_datetime(jd) for jd in (jd_fq, jd_nm, jd_lq, jd_nm_2))
     
-    jd_fq = julian_day(dt_fq)
-    moon_fq = swe.calc_ut(jd_fq, swe.MOON)[0][0]
+    # All Moon positions in a single batch
+    jds = np.array([jd_fq, jd_nm, jd_lq, jd_nm_2])
+    moon_fq, moon_nm, moon_lq, moon_nm_2 = calc_many(jds, swe.MOON)[:, 0]
     
     print(f"\n--- Event 1: June 3, 2025 ---")
     print(f"Time (UTC): {dt_fq}")
-    print(f"Moon Pos: {fmt_pos(moon_fq % 30)} (Abs: {moon_fq:.2f})")
+    print(f"Moon Pos: {fmt_sign(moon_fq)} (Abs: {moon_fq:.2f})")
     
     # Check User's Conjunctions
     print(f"Dist to Uranus ({uranus:.2f}): {abs(moon_fq - uranus):.2f}°")
     print(f"Dist to Pluto ({pluto:.2f}): {abs(moon_fq - pluto):.2f}°")
     
     # Trace Family 1 (Back 9 months to New Moon)
-    # New Moon should be ~ Sept 2024
-    start_sep24 = ephem.Date("2024/8/25")
-    nm_date = ephem.next_new_moon(start_sep24)
-    dt_nm = ephem.Date(nm_date).datetime().replace(tzinfo=pytz.UTC)
-    jd_nm = julian_day(dt_nm)
-    moon_nm = swe.calc_ut(jd_nm, swe.MOON)[0][0]
-    
     print(f"-> Family Ancestor (New Moon -9mo): {dt_nm}")
-    print(f"   Moon Pos: {fmt_pos(moon_nm % 30)} (Abs: {moon_nm:.2f})")
+    print(f"   Moon Pos: {fmt_sign(moon_nm)} (Abs: {moon_nm:.2f})")
     print(f"   Link: {abs(moon_fq - moon_nm):.2f}° difference")
 
     # 2. Verify Event 2: Dec 11, 2025 (Last Quarter)
     # User says: 20° 4' Virgo
-    start_dec = ephem.Date("2025/12/1")
-    lq_date = ephem.next_last_quarter_moon(start_dec)
-    dt_lq = ephem.Date(lq_date).datetime().replace(tzinfo=pytz.UTC)
-    
-    jd_lq = julian_day(dt_lq)
-    moon_lq = swe.calc_ut(jd_lq, swe.MOON)[0][0]
-    
     print(f"\n--- Event 2: Dec 11, 2025 ---")
     print(f"Time (UTC): {dt_lq}")
-    print(f"Moon Pos: {fmt_pos(moon_lq % 30)} (Abs: {moon_lq:.2f})")
+    print(f"Moon Pos: {fmt_sign(moon_lq)} (Abs: {moon_lq:.2f})")
     
     # Check User's Conjunctions
     print(f"Dist to Pluto ({pluto:.2f}): {abs(moon_lq - pluto):.2f}°")
     print(f"Dist to Mars ({mars:.2f}): {abs(moon_lq - mars):.2f}°")
 
     # Trace Family 2 (Back 27 months to New Moon? Or just check if Sept 2023 matches)
-    # Sequence: NM (Sep 23) -> FQ (Jun 24) -> FM (Mar 25) -> LQ (Dec 25)
-    start_sep23 = ephem.Date("2023/9/10")
-    nm_date_2 = ephem.next_new_moon(start_sep23)
-    dt_nm_2 = ephem.Date(nm_date_2).datetime().replace(tzinfo=pytz.UTC)
-    jd_nm_2 = julian_day(dt_nm_2)
-    moon_nm_2 = swe.calc_ut(jd_nm_2, swe.MOON)[0][0]
-    
     print(f"-> Family Ancestor (New Moon -27mo?): {dt_nm_2}")
-    print(f"   Moon Pos: {fmt_pos(moon_nm_2 % 30)} (Abs: {moon_nm_2:.2f})")
+    print(f"   Moon Pos: {fmt_sign(moon_nm_2)} (Abs: {moon_nm_2:.2f})")
     print(f"   Link: {abs(moon_lq - moon_nm_2):.2f}° difference")
 
 if __name__ == "__main__":
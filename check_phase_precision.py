@@ -1,44 +1,41 @@
-import ephem
 import swisseph as swe
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
 import math
+from src.utils.time_utils import to_jd
 
-# Utilities
-def to_jd(dt):
-    if dt.tzinfo:
-        dt = dt.astimezone(pytz.UTC)
-    return swe.julday(dt.year, dt.month, dt.day, dt.hour + dt.minute/60.0 + dt.second/3600.0)
+UTC = timezone.utc
 
+# Utilities
 def normalize_deg(d):
     return d % 360
 
+# Mean Moon-Sun relative speed (deg/day): 360° / 29.530589 synodic days
+LUNAR_SYNODIC_RATE = 12.19
+
+def newton_step(err, speed_deg_per_day=LUNAR_SYNODIC_RATE):
+    return err / speed_deg_per_day
+
 def check_precision():
     # Setup Feb 2025 calculation
-    start_date = datetime(2025, 1, 1, tzinfo=pytz.UTC)
-    date_ephem = ephem.Date(start_date)
-    
-    # 1. Get Time from Ephem (Current Method)
-    # Finding the Feb 5th First Quarter
-    next_q = ephem.next_first_quarter_moon(date_ephem)
-    # Advance to Feb
-    while True:
-        dt = ephem.Date(next_q).datetime()
-        dt = pytz.utc.localize(dt)
-        if dt.month == 2 and dt.year == 2025:
-            break
-        next_q = ephem.next_first_quarter_moon(next_q + 1)
-        
-    print(f"1. PyEphem Time (Current Code): {dt}")
-    
-    # 2. Check Exact Angle using Swiss Ephemeris at that time
-    jd_ephem = to_jd(dt)
+    start_date = datetime(2025, 2, 1, tzinfo=UTC)
+    jd_feb1 = to_jd(start_date)
     
     # Flags: Speed + Gregor
     flags = swe.FLG_SPEED | swe.FLG_SWIEPH
     
-    res_sun = swe.calc_ut(jd_ephem, swe.SUN, flags)
-    res_moon = swe.calc_ut(jd_ephem, swe.MOON, flags)
+    # 1. Analytic seed for the Feb 5th First Quarter
+    # Phase at Feb 1 00:00 UTC, then advance at the mean synodic rate to 90°
+    sun_feb1 = swe.calc_ut(jd_feb1, swe.SUN, flags)[0][0]
+    moon_feb1 = swe.calc_ut(jd_feb1, swe.MOON, flags)[0][0]
+    phase_now = normalize_deg(moon_feb1 - sun_feb1)
+    jd_seed = jd_feb1 + normalize_deg(90.0 - phase_now) / LUNAR_SYNODIC_RATE
+    
+    seed_dt = swe.revjul(jd_seed, swe.GREG_CAL)
+    print(f"1. Analytic Seed Time: {seed_dt[0]}-{seed_dt[1]}-{seed_dt[2]} {seed_dt[3]:.4f}h UTC")
+    
+    # 2. Check Exact Angle using Swiss Ephemeris at that time
+    res_sun = swe.calc_ut(jd_seed, swe.SUN, flags)
+    res_moon = swe.calc_ut(jd_seed, swe.MOON, flags)
     
     sun_lon = res_sun[0][0]
     moon_lon = res_moon[0][0]
@@ -54,22 +51,25 @@ def check_precision():
     # 3. Find TRUE Swiss Ephemeris Time (Iterative Search)
     # We want Moon - Sun = 90
     
-    def get_angle_err(jd):
-        s = swe.calc_ut(jd, swe.SUN, flags)[0][0]
+    # The Sun barely moves over the correction window (< 1 day): extrapolate it
+    # linearly from the seed with its own speed and only recompute the Moon.
+    sun_speed = res_sun[0][3] # deg/day
+    
+    def get_angle_err_fast(jd):
+        s = sun_lon + sun_speed * (jd - jd_seed)
         m = swe.calc_ut(jd, swe.MOON, flags)[0][0]
         d = normalize_deg(m - s)
         return d - 90.0
 
     # Newton-Raphson approximation
-    t = jd_ephem
-    for i in range(5):
-        err = get_angle_err(t)
-        # Relative speed of Moon vs Sun is approx 12-13 degrees per day
-        # So dt = err / 12.0
-        step = err / 12.0
-        t -= step
-        if abs(err) < 0.000001:
+    # Relative speed of Moon vs Sun averages ~12.19 degrees per day,
+    # so dt = err / 12.19 converges in a few iterations
+    t = jd_seed
+    for i in range(10):
+        err = get_angle_err_fast(t)
+        if abs(err) < 1e-8:
             break
+        t -= newton_step(err)
             
     true_jd = t
     true_dt = swe.revjul(true_jd, swe.GREG_CAL)
@@ -82,18 +82,34 @@ def check_precision():
     print(f"\n2. Swiss Ephemeris True Time: {true_dt[0]}-{true_dt[1]}-{true_dt[2]} {h}:{m}:{s} UTC")
     
     # Difference in time
-    time_diff_days = abs(jd_ephem - true_jd)
+    time_diff_days = abs(jd_seed - true_jd)
     time_diff_secs = time_diff_days * 24 * 3600
     
     print(f"\nCONCLUSION:")
-    print(f"Time Discrepancy: {time_diff_secs:.2f} seconds")
+    print(f"Seed Offset: {time_diff_secs:.2f} seconds")
+    
+    # Independent reference: full Sun + Moon at every step and the true
+    # relative speed from FLG_SPEED as derivative, solved to 1e-10°
+    t_ref = jd_seed
+    for i in range(20):
+        res_s = swe.calc_ut(t_ref, swe.SUN, flags)[0]
+        res_m = swe.calc_ut(t_ref, swe.MOON, flags)[0]
+        err = normalize_deg(res_m[0] - res_s[0]) - 90.0
+        if abs(err) < 1e-10:
+            break
+        t_ref -= newton_step(err, res_m[3] - res_s[3])
+    
+    ref_dt = swe.revjul(t_ref, swe.GREG_CAL)
+    print(f"Reference Time (full solve): {ref_dt[0]}-{ref_dt[1]}-{ref_dt[2]} {ref_dt[3]:.6f}h UTC")
+    
+    # Timing error of the fast Newton result against the reference
+    ref_diff_days = abs(true_jd - t_ref)
+    print(f"Discrepancy vs Reference: {ref_diff_days * 24 * 3600:.4f} seconds")
     
-    # Moon movement in that error time
-    # Moon speed approx 0.5 deg / hour = 0.0083 deg / min = 0.00013 deg / sec
-    moon_speed = res_moon[0][3] # deg/day
-    pos_error = abs(time_diff_days * moon_speed)
+    # Moon-Sun angle swept during that timing error
+    pos_error = abs(ref_diff_days * (res_m[3] - res_s[3]))
     
-    print(f"Moon Position Error caused by timing: {pos_error:.6f} degrees")
+    print(f"Angle Error vs Reference: {pos_error:.8f} degrees")
     
     if pos_error < 0.01:
         print("Verdict: IMPECCABLE (Error < 0.01°)")
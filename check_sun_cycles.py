@@ -1,37 +1,46 @@
 import swisseph as swe
-import pytz
-from datetime import datetime
-import ephem
-
-def julian_day(dt):
-    if dt.tzinfo:
-        dt = dt.astimezone(pytz.UTC)
-    return swe.julday(dt.year, dt.month, dt.day, dt.hour + dt.minute/60.0 + dt.second/3600.0)
-
-def fmt_pos(deg):
-    signs = ['Ari', 'Tau', 'Gem', 'Can', 'Leo', 'Vir', 'Lib', 'Sco', 'Sag', 'Cap', 'Aqu', 'Pis']
-    s = int(deg / 30)
-    d = deg % 30
-    return f"{signs[s]} {d:.2f}°"
+import numpy as np
+from src.utils.swe_batch import calc_many
+from src.utils.time_utils import jds_from_dt64
+from src.utils.math_utils import fmt_sign
+from src.utils.lunation_sweep import (
+    find_lunations, next_lunation, jd_to_datetime,
+    NEW_MOON, FIRST_QUARTER, LAST_QUARTER
+)
 
 def check_sun_cycles():
     # Natal Sun: Capricorn 5°16'
     # Cap is sign 9. 9*30 + 5.27 = 275.27
     natal_sun = 275.27
-    print(f"Natal Sun: {fmt_pos(natal_sun)} (Abs: {natal_sun:.2f})")
+    print(f"Natal Sun: {fmt_sign(natal_sun)} (Abs: {natal_sun:.2f})")
     
     # 1. Investigate Dec 2025 New Moon (The missing one)
-    start_dec25 = ephem.Date("2025/12/01")
-    nm_date = ephem.next_new_moon(start_dec25)
-    dt_nm = ephem.Date(nm_date).datetime().replace(tzinfo=pytz.UTC)
+    # Sweep bounds and search anchors (UTC) converted in one pass
+    jd_start, jd_end, jd_dec25, jd_mar25, jd_sep25, jd_dec24 = jds_from_dt64(np.array(
+        ['2022-12-01', '2026-01-01', '2025-12-01', '2025-03-15', '2025-09-15', '2024-12-15'],
+        dtype='datetime64[ns]'
+    ))
+    
+    # All lunations from Dec 2022 to Dec 2025 in a single sweep
+    lunations = find_lunations(jd_start, jd_end)
+    
+    jd_nm = next_lunation(lunations, NEW_MOON, jd_dec25)
+    jd_lq = next_lunation(lunations, LAST_QUARTER, jd_mar25)
+    jd_nm22 = next_lunation(lunations, NEW_MOON, jd_start)
+    jd_fq = next_lunation(lunations, FIRST_QUARTER, jd_sep25)
+    jd_nm24 = next_lunation(lunations, NEW_MOON, jd_dec24)
+    
+    dt_nm, dt_lq, dt_nm22, dt_fq, dt_nm24 = (
+        jd_to_datetime(jd) for jd in (jd_nm, jd_lq, jd_nm22, jd_fq, jd_nm24)
+    )
     
-    jd_nm = julian_day(dt_nm)
-    sun_nm = swe.calc_ut(jd_nm, swe.SUN)[0][0]
-    moon_nm = swe.calc_ut(jd_nm, swe.MOON)[0][0] # Should be same
+    # All Moon positions in a single batch (at New Moon the Sun is at the same degree)
+    jds = np.array([jd_nm, jd_lq, jd_nm22, jd_fq, jd_nm24])
+    moon_nm, moon_lq, moon_nm22, moon_fq, moon_nm24 = calc_many(jds, swe.MOON)[:, 0]
     
     print(f"\n--- Investigating New Moon Dec 2025 ---")
     print(f"Time (UTC): {dt_nm}")
-    print(f"Sun/Moon Pos: {fmt_pos(moon_nm)} (Abs: {moon_nm:.2f})")
+    print(f"Sun/Moon Pos: {fmt_sign(moon_nm)} (Abs: {moon_nm:.2f})")
     
     dist = abs(moon_nm - natal_sun)
     if dist > 180: dist = 360 - dist
@@ -41,15 +50,9 @@ def check_sun_cycles():
     
     # 2. Analyze Mar 22, 2025 (Last Quarter)
     # User says: 2° 5' Capricorn
-    start_mar25 = ephem.Date("2025/3/15")
-    lq_date = ephem.next_last_quarter_moon(start_mar25)
-    dt_lq = ephem.Date(lq_date).datetime().replace(tzinfo=pytz.UTC)
-    jd_lq = julian_day(dt_lq)
-    moon_lq = swe.calc_ut(jd_lq, swe.MOON)[0][0]
-    
     print(f"\n--- Event: Mar 22, 2025 (Last Quarter) ---")
     print(f"Time (UTC): {dt_lq}")
-    print(f"Moon Pos: {fmt_pos(moon_lq)} (Abs: {moon_lq:.2f})")
+    print(f"Moon Pos: {fmt_sign(moon_lq)} (Abs: {moon_lq:.2f})")
     
     # Trace Ancestor (LQ completes a cycle started 27 months ago?)
     # LQ is 270 deg ahead of Sun.
@@ -58,37 +61,19 @@ def check_sun_cycles():
     # Antecedent NM should be ~ Dec 2022.
     
     # Let's just calculate Dec 2022 New Moon to see if it matches degree
-    start_dec22 = ephem.Date("2022/12/01")
-    nm_22 = ephem.next_new_moon(start_dec22)
-    dt_nm22 = ephem.Date(nm_22).datetime().replace(tzinfo=pytz.UTC)
-    jd_nm22 = julian_day(dt_nm22)
-    moon_nm22 = swe.calc_ut(jd_nm22, swe.MOON)[0][0]
-    
     print(f"-> Potential Ancestor (NM Dec 2022): {dt_nm22}")
-    print(f"   Pos: {fmt_pos(moon_nm22)}")
+    print(f"   Pos: {fmt_sign(moon_nm22)}")
     print(f"   Diff: {abs(moon_lq - moon_nm22):.2f}°")
 
     # 3. Analyze Sept 29, 2025 (First Quarter)
     # User says: 7° 6' Capricorn
-    start_sep25 = ephem.Date("2025/9/15")
-    fq_date = ephem.next_first_quarter_moon(start_sep25)
-    dt_fq = ephem.Date(fq_date).datetime().replace(tzinfo=pytz.UTC)
-    jd_fq = julian_day(dt_fq)
-    moon_fq = swe.calc_ut(jd_fq, swe.MOON)[0][0]
-    
     print(f"\n--- Event: Sept 29, 2025 (First Quarter) ---")
     print(f"Time (UTC): {dt_fq}")
-    print(f"Moon Pos: {fmt_pos(moon_fq)} (Abs: {moon_fq:.2f})")
+    print(f"Moon Pos: {fmt_sign(moon_fq)} (Abs: {moon_fq:.2f})")
     
     # Ancestor (FQ is month 9). NM should be ~ Dec 2024.
-    start_dec24 = ephem.Date("2024/12/15")
-    nm_24 = ephem.next_new_moon(start_dec24)
-    dt_nm24 = ephem.Date(nm_24).datetime().replace(tzinfo=pytz.UTC)
-    jd_nm24 = julian_day(dt_nm24)
-    moon_nm24 = swe.calc_ut(jd_nm24, swe.MOON)[0][0]
-    
     print(f"-> Potential Ancestor (NM Dec 2024): {dt_nm24}")
-    print(f"   Pos: {fmt_pos(moon_nm24)}")
+    print(f"   Pos: {fmt_sign(moon_nm24)}")
     print(f"   Diff: {abs(moon_fq - moon_nm24):.2f}°")
 
 if __name__ == "__main__":
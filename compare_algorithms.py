@@ -1,6 +1,7 @@
 
 import sys
 import time
+import bisect
 import swisseph as swe
 from datetime import datetime
 from zoneinfo import ZoneInfo
@@ -10,6 +11,23 @@ import concurrent.futures
 # Force Swisseph to use Moshier (no files) preventing crashes in V4
 swe.set_ephe_path('')
 
+# --- SHARED EPHEMERIS CACHE ---
+# POC and V4 sweep the same year, so most (jd, planet, flags) lookups repeat.
+# Memoize swe.calc_ut process-wide; V4 (via immanuel) hits the same module.
+# Keyed on the exact jd (like V4's ephemeris_cache): rounding would hand back
+# a neighbouring instant's position inside the POC's bisection.
+_calc_cache = {}
+_orig_calc_ut = swe.calc_ut
+
+def _cached_calc_ut(jd, planet, flags=swe.FLG_SWIEPH | swe.FLG_SPEED, _cache=_calc_cache):
+    key = (jd, planet, flags)
+    res = _cache.get(key)
+    if res is None:
+        res = _cache[key] = _orig_calc_ut(jd, planet, flags)
+    return res
+
+swe.calc_ut = _cached_calc_ut
+
 # Monkeypatch potential re-setters if possible, or just hope V4 respects the global
 # We also need to mock natal data that V4 expects
 NATAL_DATA = {
@@ -58,6 +76,7 @@ def run_comparison():
     
     # --- 1. RUN POC ---
     print("\n[1] Ejecutando POC Vectorizado...")
+    _calc_cache.clear()
     t0 = time.time()
     poc_calc = PocVectorizedTransitsCalculator(NATAL_DATA)
     poc_events = poc_calc.calculate_all(start_date, end_date)
@@ -71,6 +90,8 @@ def run_comparison():
     # Note: V4 uses 'swe' which maps to the C extension. 
     # Global state should hold if we don't reload.
     
+    # Cold cache for V4 too, so both timings are comparable
+    _calc_cache.clear()
     t0 = time.time()
     v4_calc = AstronomicalTransitsCalculatorV4(NATAL_DATA)
     
@@ -105,6 +126,7 @@ def run_comparison():
     t1 = time.time()
     v4_time = t1 - t0
     print(f"    -> V4 terminó en {v4_time:.4f}s. Encontró {len(v4_events)} eventos (filtrados solo planetas).")
+    print(f"       (caché de efemérides de V4: {len(_calc_cache)} posiciones)")
     
     # --- 3. COMPARE ---
     print("\n[3] Análisis de Coincidencias...")
@@ -115,6 +137,12 @@ def run_comparison():
         k = (e.planeta1, e.planeta2, e.tipo_aspecto)
         if k not in poc_map: poc_map[k] = []
         poc_map[k].append(e)
+    
+    # Sort each key's events by time so the nearest match is a bisect away
+    poc_times = {}
+    for k, events in poc_map.items():
+        events.sort(key=lambda e: e.fecha_utc)
+        poc_times[k] = [e.fecha_utc for e in events]
         
     matched_count = 0
     missing_in_poc = 0
@@ -130,16 +158,12 @@ def run_comparison():
         
         found = False
         if k in poc_map:
-            # Find closest time match
+            # Find closest time match: only the neighbours around the insertion point
             candidates = poc_map[k]
-            best_diff = 999999
-            best_match = None
-            
-            for poc_e in candidates:
-                diff_seconds = abs((v4_e.fecha_utc - poc_e.fecha_utc).total_seconds())
-                if diff_seconds < best_diff:
-                    best_diff = diff_seconds
-                    best_match = poc_e
+            idx = bisect.bisect_left(poc_times[k], v4_e.fecha_utc)
+            nearest = [candidates[i] for i in (idx - 1, idx) if 0 <= i < len(candidates)]
+            best_match = min(nearest, key=lambda p: abs((p.fecha_utc - v4_e.fecha_utc).total_seconds()))
+            best_diff = abs((best_match.fecha_utc - v4_e.fecha_utc).total_seconds())
                     
             # Tolerance: 15 minutes (V4 might be slightly inaccurate due to iterative steps vs root finding)
             if best_diff < 900: # 15 minutes
@@ -52,32 +52,37 @@ def run_december_check():
         {"p1": "Venus", "p2": "Sol", "asp": "Conjunción", "seek_time": "Dec 28, 18:06"}
     ]
     
+    bsas_tz = ZoneInfo("America/Argentina/Buenos_Aires")
+    
+    # Index POC events once by (planet1, planet2, aspect)
+    events_by_key = {}
+    for e in events:
+        events_by_key.setdefault((e.planeta1, e.planeta2, e.tipo_aspecto), []).append(e)
+    
+    # Parse AstroSeek times once (local Buenos Aires), e.g. "Dec 1, 04:42"
+    seek_times = []
+    for t in targets:
+        _, day, hm = t["seek_time"].replace(",", "").split(" ")
+        h, m = hm.split(":")
+        seek_times.append((int(day), datetime(2025, 12, int(day), int(h), int(m), tzinfo=bsas_tz)))
+    
     print(f"{'EVENTO':<40} | {'POC (UTC)':<20} | {'POC (BsAs)':<20} | {'ASTROSEEK':<15} | {'DIFERENCIA':<10}")
     print("-" * 115)
     
     found_count = 0
     
-    for t in targets:
-        # Find matching event in POC results
-        match = None
-        for e in events:
-            # Map names if needed, but POC uses Spanish names already
-            if (e.planeta1 == t["p1"] and 
-                e.planeta2 == t["p2"] and 
-                e.tipo_aspecto == t["asp"]):
-                
-                # Check if date is close (Dec +/- 1 day) to handle duplicate aspects
-                # AstroSeek "Dec 1" means 2025-12-01
-                # Parse seek day
-                seek_day = int(t["seek_time"].split(",")[0].split(" ")[1])
-                if abs(e.fecha_utc.day - seek_day) <= 1:
-                    match = e
-                    break
+    for t, (seek_day, dt_seek) in zip(targets, seek_times):
+        # POC uses Spanish names already. Keep candidates within Dec +/- 1 day
+        # to handle duplicate aspects, then take the closest to AstroSeek's time.
+        candidates = [
+            e for e in events_by_key.get((t["p1"], t["p2"], t["asp"]), [])
+            if abs(e.fecha_utc.day - seek_day) <= 1
+        ]
+        match = min(candidates, key=lambda e: abs(e.fecha_utc - dt_seek), default=None)
         
         if match:
             found_count += 1
             # Convert POC to Buenos Aires for comparison
-            bsas_tz = ZoneInfo("America/Argentina/Buenos_Aires")
             dt_bsas = match.fecha_utc.astimezone(bsas_tz)
             
             # Print row
@@ -85,19 +90,9 @@ def run_december_check():
             poc_utc = match.fecha_utc.strftime("%d %H:%M")
             poc_local = dt_bsas.strftime("%d %H:%M")
             
-            # Calc timediff roughly (assuming AstroSeek is Local)
-            # Parse AstroSeek time "Dec 1, 04:42"
-            try:
-                parts = t["seek_time"].replace(",", "").split(" ")
-                day = int(parts[1])
-                hm = parts[2].split(":")
-                h, m = int(hm[0]), int(hm[1])
-                dt_seek = datetime(2025, 12, day, h, m, tzinfo=bsas_tz)
-                
-                diff_minutes = (dt_bsas - dt_seek).total_seconds() / 60
-                diff_str = f"{diff_minutes:+.1f} min"
-            except:
-                diff_str = "?"
+            # Calc timediff (AstroSeek is Local)
+            diff_minutes = (dt_bsas - dt_seek).total_seconds() / 60
+            diff_str = f"{diff_minutes:+.1f} min"
                 
             print(f"{event_str:<40} | {poc_utc:<20} | {poc_local:<20} | {t['seek_time']:<15} | {diff_str:<10}")
         else:
@@ -1,19 +1,26 @@
 
 import csv
+import io
 import re
+import unicodedata
+from pathlib import Path
+
+# Pattern: matches "(planet) (...) por tránsito esta en (aspect) a tu (planet) natal"
+# Anchored at the start and with a bounded "(...)" so non-matching rows fail fast
+_RAG_PATTERN = re.compile(
+    r"^\s*([a-záéíóúüñ]+)\s*\([^)]*\)\s*por tránsito esta en\s+([a-záéíóúüñ]+)\s+a tu\s+([a-záéíóúüñ]+)\s+natal"
+)
 
 def normalize_rag_title(raw_title):
     """
     Transforms: 'Sol (directo) por tránsito esta en Trígono a tu Urano Natal'
     To: 'sol en tránsito trígono a urano natal'
     """
-    # 1. Lowercase
-    lower_title = raw_title.lower()
+    # 1. Compose accents (NFC) so 'ú' always matches the regex class, then lowercase
+    lower_title = unicodedata.normalize("NFC", raw_title).lower()
     
-    # 2. Extract components using regex
-    # Pattern: metches "(planet) (...) por tránsito esta en (aspect) a tu (planet) natal"
-    pattern = r"([a-záéíóúüñ]+)\s*\(.*?\)\s*por tránsito esta en\s*([a-záéíóúüñ]+)\s*a tu\s*([a-záéíóúüñ]+)\s*natal"
-    match = re.search(pattern, lower_title)
+    # 2. Extract components using the precompiled regex
+    match = _RAG_PATTERN.match(lower_title)
     
     if match:
         p1 = match.group(1)
@@ -28,26 +35,32 @@ def main():
     input_csv = "reporte_faltantes_rag.csv"
     output_txt = "titulos_faltantes_para_index.txt"
     
-    titles_to_write = []
+    # Titles are deduplicated while reading
+    seen = set()
+    add = seen.add
     
     try:
-        with open(input_csv, mode='r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                raw_title = row.get("Titulo_Requerido", "")
-                if raw_title:
-                    normalized = normalize_rag_title(raw_title)
-                    if "FAILED_TO_PARSE" not in normalized:
-                        titles_to_write.append(normalized)
-                    else:
-                        print(f"Warning: Could not parse '{raw_title}'")
-
-        # Remove duplicates and sort
-        unique_titles = sorted(list(set(titles_to_write)))
+        # Read and decode the whole report in one call (dropping any BOM), then parse from memory
+        text = Path(input_csv).read_text(encoding='utf-8-sig')
+        
+        # Only one column is needed: resolve its index once and read plain lists
+        reader = csv.reader(io.StringIO(text, newline=''))
+        header = next(reader)
+        idx = header.index("Titulo_Requerido")
+        for row in reader:
+            raw_title = row[idx] if idx < len(row) else ""
+            if raw_title:
+                normalized = normalize_rag_title(raw_title)
+                if "FAILED_TO_PARSE" not in normalized:
+                    add(normalized)
+                else:
+                    print(f"Warning: Could not parse '{raw_title}'")
+
+        unique_titles = sorted(seen)
 
         with open(output_txt, mode='w', encoding='utf-8') as f:
-            for title in unique_titles:
-                f.write(title + "\n")
+            if unique_titles:
+                f.write("\n".join(unique_titles) + "\n")
                 
         print(f"✅ Successfully generated '{output_txt}' with {len(unique_titles)} unique titles.")
         print("First 5 titles:")
@@ -0,0 +1,11 @@
+"""
+Configuración común de Swiss Ephemeris para los scripts debug_*.py
+"""
+import swisseph as swe
+from src.core.ephemeris import ensure_ephe_path
+
+# Combinaciones de flags usadas por los scripts forenses
+FLAGS_SWIEPH = swe.FLG_SPEED | swe.FLG_SWIEPH
+FLAGS_MOSEPH = swe.FLG_SPEED | swe.FLG_MOSEPH
+
+ensure_ephe_path()
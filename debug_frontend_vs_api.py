@@ -3,8 +3,15 @@
 Script para comparar los datos que recibe el frontend vs la API directa
 """
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+# Sesión compartida: reutiliza la conexión (keep-alive) entre peticiones.
+# El pool alcanza para las consultas concurrentes por año sin abrir sockets extra.
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
 
 def test_api_direct():
     """Prueba directa a la API"""
@@ -27,7 +34,7 @@ def test_api_direct():
     print(f"Datos enviados: {json.dumps(data, indent=2)}")
     
     try:
-        response = requests.post(url, json=data, timeout=30)
+        response = SESSION.post(url, json=data, timeout=30)
         print(f"Status Code: {response.status_code}")
         
         if response.status_code == 200:
@@ -84,13 +91,21 @@ def test_with_different_params():
         }
     }
     
-    for year in [2024, 2025, 2026]:
+    url = "http://localhost:8004/calculate-personal-calendar-dynamic"
+    years = (2024, 2025, 2026)
+    
+    # Las peticiones son independientes: se lanzan en paralelo y se imprimen en orden
+    with ThreadPoolExecutor(max_workers=len(years)) as ex:
+        futures = {
+            year: ex.submit(SESSION.post, url, json={**base_data, "year": year}, timeout=30)
+            for year in years
+        }
+    
+    for year in years:
         print(f"\n--- Año {year} ---")
-        data = {**base_data, "year": year}
         
         try:
-            response = requests.post("http://localhost:8004/calculate-personal-calendar-dynamic", 
-                                   json=data, timeout=30)
+            response = futures[year].result()
             if response.status_code == 200:
                 result = response.json()
                 
@@ -2,8 +2,10 @@
 Debug script para verificar si el problema está en la serialización JSON
 """
 import json
+import math
 from datetime import datetime
 from zoneinfo import ZoneInfo
+from src.api.schemas_strict import HouseTransitStrict
 from src.calculators.progressed_moon_transits import ProgressedMoonTransitsCalculator
 
 def test_moon_degree_serialization():
@@ -65,8 +67,9 @@ def test_moon_degree_serialization():
     print(f"moon_data['grado']: {moon_data['grado']}")
     print(f"Tipo: {type(moon_data['grado'])}")
     
-    # Serializar a JSON (como hace FastAPI)
-    json_str = json.dumps(moon_data, ensure_ascii=False)
+    # Serializar a JSON por el mismo camino que el servicio: el dict se convierte a
+    # HouseTransitStrict (con float(grado)) y la respuesta sale por model_dump_json
+    json_str = HouseTransitStrict(**{**moon_data, 'grado': float(moon_data['grado'])}).model_dump_json()
     print(f"\n=== JSON SERIALIZADO ===")
     print(f"JSON: {json_str}")
     
@@ -81,9 +84,9 @@ def test_moon_degree_serialization():
     test_values = [1.0, 1.1, 1.5, 1.9, 2.0]
     
     for val in test_values:
-        data = {'grado': val}
-        json_str = json.dumps(data)
+        json_str = HouseTransitStrict(**{**moon_data, 'grado': val}).model_dump_json()
         deserialized = json.loads(json_str)
+        assert math.isclose(deserialized['grado'], val)
         print(f"Original: {val} ({type(val)}) -> JSON: {json_str} -> Deserializado: {deserialized['grado']} ({type(deserialized['grado'])})")
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ Script para debuggear y comparar datos natales entre el formato original y el mi
 import json
 import sys
 import os
+import numpy as np
 
 # Agregar el directorio padre al path para importar módulos
 sys.path.append('/Users/apple/astro_calendar_personal_v3')
@@ -29,6 +30,13 @@ def generar_datos_natales_completos():
     
     return natal_data
 
+def puntos_a_arrays(points):
+    """Convierte el dict de puntos en arrays paralelos (nombres, longitudes, signos)."""
+    names = np.array(list(points.keys()))
+    lons = np.fromiter((v['longitude'] for v in points.values()), dtype=np.float64, count=len(points))
+    signs = np.array([v['sign'] for v in points.values()])
+    return names, lons, signs
+
 def comparar_datos():
     """Compara datos natales completos vs. datos actuales del microservicio."""
     
@@ -43,6 +51,10 @@ def comparar_datos():
     print("COMPARACIÓN DE DATOS NATALES")
     print("="*80)
     
+    # Vista en arrays de ambos conjuntos de puntos
+    names_full, lons_full, signs_full = puntos_a_arrays(datos_completos['points'])
+    names_actual, lons_actual, signs_actual = puntos_a_arrays(datos_actuales['points'])
+    
     print("\n1. PUNTOS/PLANETAS:")
     print("-" * 40)
     print("Datos completos (script original):")
@@ -53,10 +65,18 @@ def comparar_datos():
     for punto, data in datos_actuales['points'].items():
         print(f"  {punto}: {data['sign']} {data['position']}")
     
+    # Diferencia de longitud en los puntos comunes, en una sola operación
+    comunes, i_full, i_actual = np.intersect1d(names_full, names_actual, assume_unique=True, return_indices=True)
+    diff = np.abs(lons_full[i_full] - lons_actual[i_actual])
+    diff = np.minimum(diff, 360.0 - diff)
+    print("\nDiferencia de longitud (completos vs actuales):")
+    for punto, d, s1, s2 in zip(comunes, diff, signs_full[i_full], signs_actual[i_actual]):
+        print(f"  {punto}: {d:.2f}° ({s1} / {s2})")
+    
     print("\n2. CAMPOS FALTANTES EN MICROSERVICIO:")
     print("-" * 40)
-    puntos_faltantes = set(datos_completos['points'].keys()) - set(datos_actuales['points'].keys())
-    if puntos_faltantes:
+    puntos_faltantes = np.setdiff1d(names_full, names_actual, assume_unique=True)
+    if puntos_faltantes.size:
         for punto in puntos_faltantes:
             data = datos_completos['points'][punto]
             print(f"  ❌ {punto}: {data['sign']} {data['position']}")
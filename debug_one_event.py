@@ -1,20 +1,25 @@
 
+import functools
 import swisseph as swe
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
-# Setup
-swe.set_ephe_path('/Users/apple/astro-calendar-personal-fastapi/src/immanuel/resources/ephemeris')
+# Setup: path de efemérides y flags compartidos
+from debug_common import FLAGS_SWIEPH
 
 # Target: Transit Venus Conjunction Natal Saturn
 # Natal Saturn (from script): 330.435 (Pisces 0°26')
 
 natal_saturn = 330.435
 
+@functools.lru_cache(maxsize=4096)
+def _jd(y, m, d, h, mn):
+    return swe.julday(y, m, d, h + mn/60.0)
+
 def get_venus_pos(dt_str):
-    dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-    jd = swe.julday(dt.year, dt.month, dt.day, dt.hour + dt.minute/60.0)
-    res = swe.calc_ut(jd, swe.VENUS, swe.FLG_SPEED | swe.FLG_SWIEPH)
+    dt = datetime.strptime(dt_str, "%Y-%m-%dT%H:%M:%SZ")
+    jd = _jd(dt.year, dt.month, dt.day, dt.hour, dt.minute)
+    res = swe.calc_ut(jd, swe.VENUS, FLAGS_SWIEPH)
     return res[0][0], jd
 
 print("=== FORENSE: VENUS CONJUNCIÓN SATURNO ===")
@@ -1,34 +1,44 @@
 import sys
 import os
-from datetime import datetime
-import pytz
-import ephem
+from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 import swisseph as swe
+import numpy as np
+from src.utils.swe_batch import calc_many
+from src.utils.lunation_sweep import (
+    find_lunations, jd_to_datetime,
+    NEW_MOON, FIRST_QUARTER, FULL_MOON, LAST_QUARTER
+)
+
+PHASE_NAMES = {
+    NEW_MOON: "Luna Nueva",
+    FIRST_QUARTER: "Cuarto Creciente",
+    FULL_MOON: "Luna Llena",
+    LAST_QUARTER: "Cuarto Menguante",
+}
 
 # Basic conversions
 def julian_day(dt):
     # Convert to UTC if not
     if dt.tzinfo:
-        dt = dt.astimezone(pytz.UTC)
+        dt = dt.astimezone(timezone.utc)
     return swe.julday(dt.year, dt.month, dt.day, dt.hour + dt.minute/60.0 + dt.second/3600.0)
 
-def _calcular_orbe(pos1: float, pos2: float) -> float:
-    diff = abs(pos1 - pos2)
-    if diff > 180:
-        diff = 360 - diff
-    return diff
+def _calcular_orbe(pos1, pos2):
+    """Orbe angular (0-180°) elemento a elemento; acepta arrays o escalares."""
+    diff = np.abs(np.subtract(pos1, pos2))
+    return np.minimum(diff, 360.0 - diff)
 
 def debug_check():
     # 1. Setup Natal Data
     # 1964-12-26 21:12 Buenos Aires (-3)
     local_dt = datetime(1964, 12, 26, 21, 12, tzinfo=ZoneInfo("America/Argentina/Buenos_Aires"))
-    utc_dt = local_dt.astimezone(pytz.UTC)
+    utc_dt = local_dt.astimezone(timezone.utc)
     jd_natal = julian_day(utc_dt)
     
     # Scan 2024-2026 for phases conjunct Pluto
-    start_dt = datetime(2024, 1, 1, tzinfo=pytz.UTC)
-    end_dt = datetime(2026, 12, 31, tzinfo=pytz.UTC)
+    start_dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    end_dt = datetime(2026, 12, 31, tzinfo=timezone.utc)
     
     # Calculate Pluto Natal
     res = swe.calc_ut(jd_natal, swe.PLUTO)
@@ -37,39 +47,28 @@ def debug_check():
     
     print("\n--- Escaneando Fases en Conjunción con Plutón (Orb 4°) 2024-2026 ---")
     
-    curr = ephem.Date(start_dt)
-    end = ephem.Date(end_dt)
+    # 1. Every phase in the range from a single Moon-Sun elongation sweep
+    jd_start = julian_day(start_dt)
+    jd_end = julian_day(end_dt)
+    lunations = find_lunations(jd_start, jd_end, step=1.0)
+    phases = sorted(
+        (jd, PHASE_NAMES[target])
+        for target, roots in lunations.items()
+        for jd in roots
+        if jd_start <= jd <= jd_end
+    )
     
-    # Helper to process a date
-    def check_date(name, d_ephem):
-        dt = ephem.Date(d_ephem).datetime()
-        dt = pytz.utc.localize(dt)
-        if dt > end_dt: return
-        
-        jd = julian_day(dt)
-        m_pos = swe.calc_ut(jd, swe.MOON)[0][0]
-        orb = _calcular_orbe(m_pos, pluto_abs)
-        
-        if orb <= 5.0: # Check a bit wider to see near misses
-            print(f"{dt.date()} {name:<16} Moon: {m_pos:.2f}° Orb: {orb:.2f}° {'✅' if orb <= 4.0 else '❌'}")
-
-    while curr < end:
-        # Get next 4 phases
-        nm = ephem.next_new_moon(curr)
-        fq = ephem.next_first_quarter_moon(curr)
-        fm = ephem.next_full_moon(curr)
-        lq = ephem.next_last_quarter_moon(curr)
-        
-        # Find the earliest one to advance loop
-        next_event = min(nm, fq, fm, lq)
-        
-        if next_event == nm: check_date("Luna Nueva", nm)
-        elif next_event == fq: check_date("Cuarto Creciente", fq)
-        elif next_event == fm: check_date("Luna Llena", fm)
-        elif next_event == lq: check_date("Cuarto Menguante", lq)
-        
-        curr = next_event + 0.01 # Advance slightly
-
+    # 2. Moon positions in a single batch, then vectorized orbs
+    jds = np.array([jd for jd, _ in phases])
+    moon_pos = calc_many(jds, swe.MOON)[:, 0]
+    
+    orb = _calcular_orbe(moon_pos, pluto_abs)
+    mask = orb <= 5.0 # Check a bit wider to see near misses
+    
+    for i in np.flatnonzero(mask):
+        name = phases[i][1]
+        dt = jd_to_datetime(jds[i])
+        print(f"{dt.date()} {name:<16} Moon: {moon_pos[i]:.2f}° Orb: {orb[i]:.2f}° {'✅' if orb[i] <= 4.0 else '❌'}")
 
 
 if __name__ == "__main__":
@@ -1,20 +1,27 @@
 
 import csv
-import swisseph as swe
-from datetime import datetime
-from zoneinfo import ZoneInfo
-from src.calculators.transits_calculator_factory import TransitsCalculatorFactory
-
-# Ensure Ephemeris Path
-swe.set_ephe_path('/Users/apple/astro-calendar-personal-fastapi/src/immanuel/resources/ephemeris')
+import os
+import pickle
+from hashlib import blake2b
+from src.core.ephemeris import ensure_ephe_path
+from natal_cache import BIRTH_DT_LOCAL, BIRTH_LAT, BIRTH_LON
+from transit_cache import compute_year_events
 
 RAG_CSV_PATH = '/Users/apple/astro_interpretador_rag_fastapi/eventos_con_interpretacion.csv'
 OUTPUT_CSV = 'reporte_faltantes_rag.csv'
+CSV_BUFFER = 1 << 20  # 1 MiB
+# Índice de fingerprints ya parseado; se invalida cuando cambia el CSV RAG
+KNOWN_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.rag_known.pkl')
 
-def load_known_Interpretations():
+def fp(text):
+    """64-bit BLAKE2 fingerprint of a description (fixed-size set key)."""
+    return blake2b(text.encode('utf-8'), digest_size=8).digest()
+
+def _read_known():
+    """Parse RAG_CSV_PATH into a frozenset of description fingerprints."""
     known = set()
     try:
-        with open(RAG_CSV_PATH, 'r', encoding='utf-8') as f:
+        with open(RAG_CSV_PATH, 'r', encoding='utf-8', buffering=CSV_BUFFER) as f:
             reader = csv.reader(f)
             headers = next(reader)
             # Find 'descripcion' column index
@@ -22,84 +29,87 @@ def load_known_Interpretations():
                 desc_idx = headers.index('descripcion')
             except ValueError:
                 print("Error: Columna 'descripcion' no encontrada en CSV RAG.")
-                return known
+                return frozenset(known)
 
-            for row in reader:
-                if len(row) > desc_idx:
-                    desc = row[desc_idx].strip()
-                    if desc:
-                        known.add(desc)
+            known = {
+                fp(desc)
+                for desc in (row[desc_idx].strip() for row in reader if len(row) > desc_idx)
+                if desc
+            }
     except Exception as e:
         print(f"Error leyendo CSV RAG: {e}")
     
-    print(f"Interpretaciones Conocidas Cargadas: {len(known)}")
-    return known
+    return frozenset(known)
 
-def generate_report():
-    # 1. Load Known
-    known_titles = load_known_Interpretations()
-    
-    # 2. Calculate 2025 Events (Same Logic as generate_final_csv.py)
-    planet_map = {
-        0: "Sun", 1: "Moon", 2: "Mercury", 3: "Venus", 4: "Mars", 
-        5: "Jupiter", 6: "Saturn", 7: "Uranus", 8: "Neptune", 9: "Pluto"
-    }
-    
-    # Natal Data (AstroSeek / User confirmed)
-    birth_dt_local = datetime(1964, 12, 26, 21, 12, tzinfo=ZoneInfo("America/Argentina/Buenos_Aires"))
-    birth_dt_utc = birth_dt_local.astimezone(ZoneInfo("UTC"))
-    jd_birth = swe.julday(birth_dt_utc.year, birth_dt_utc.month, birth_dt_utc.day, 
-                          birth_dt_utc.hour + birth_dt_utc.minute/60.0 + birth_dt_utc.second/3600.0)
-    
-    points = {}
-    for pid, name in planet_map.items():
-        res = swe.calc_ut(jd_birth, pid, swe.FLG_SPEED | swe.FLG_SWIEPH)
-        points[name] = {'longitude': res[0][0]}
+def load_known_Interpretations():
+    """Fingerprints (see fp) of every description that already has an interpretation."""
+    try:
+        st = os.stat(RAG_CSV_PATH)
+        stamp = (RAG_CSV_PATH, st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
 
-    natal_data = {
-        'points': points,
-        'location': {
-            'latitude': -34.6037,
-            'longitude': -58.3816,
-            'timezone': 'America/Argentina/Buenos_Aires'
-        }
-    }
+    known = None
+    if stamp is not None:
+        try:
+            with open(KNOWN_CACHE, 'rb') as f:
+                cached_stamp, cached_known = pickle.load(f)
+            if cached_stamp == stamp:
+                known = cached_known
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            pass
 
-    print("Calculando Tránsitos 2025...")
-    calc = TransitsCalculatorFactory.create_calculator(natal_data, calculator_type="vectorized")
-    start_date = datetime(2025, 1, 1, tzinfo=ZoneInfo("UTC"))
-    end_date = datetime(2025, 12, 31, 23, 59, tzinfo=ZoneInfo("UTC"))
-    events = calc.calculate_all(start_date, end_date)
-    print(f"Total Eventos 2025: {len(events)}")
-    
-    # 3. Find Missing
-    missing_events = []
-    seen_missing = set() # To avoid duplicates in report
-    
+    if known is None:
+        known = _read_known()
+        # Sólo se guarda si el CSV existía (un error de lectura no se cachea)
+        if stamp is not None:
+            with open(KNOWN_CACHE, 'wb') as f:
+                pickle.dump((stamp, known), f, protocol=5)
+
+    print(f"Interpretaciones Conocidas Cargadas: {len(known)}")
+    return known
+
+def write_missing_csv(events, known_titles, path=OUTPUT_CSV):
+    """Write one example event per description that has no RAG interpretation."""
+    # First event per missing description, in insertion order (no duplicates in report)
+    missing = {}
     for e in events:
         desc = e.descripcion.strip()
-        if desc not in known_titles:
-            if desc not in seen_missing:
-                missing_events.append(e)
-                seen_missing.add(desc)
+        if desc not in missing and fp(desc) not in known_titles:
+            missing[desc] = e
+    missing_events = missing.values()
     
-    print(f"Eventos Faltantes (Sin Interpretación): {len(missing_events)}")
+    print(f"Eventos Faltantes (Sin Interpretación): {len(missing)}")
     
-    # 4. Write CSV
-    with open(OUTPUT_CSV, 'w', newline='', encoding='utf-8') as f:
+    with open(path, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER) as f:
         writer = csv.writer(f)
         writer.writerow(["Titulo_Requerido", "Fecha_Ejemplo", "Planeta1", "Aspecto", "Planeta2"])
-        
-        for e in missing_events:
-            writer.writerow([
+        writer.writerows(
+            (
                 e.descripcion,
                 e.fecha_utc.strftime("%Y-%m-%d"),
                 e.planeta1,
                 e.tipo_aspecto,
                 e.planeta2
-            ])
+            )
+            for e in missing_events
+        )
             
-    print(f"✅ Reporte generado: {OUTPUT_CSV}")
+    print(f"✅ Reporte generado: {path}")
+
+def generate_report():
+    # Ensure Ephemeris Path (bundled .se1 files); idempotent per thread
+    ensure_ephe_path()
+    # 1. Load Known
+    known_titles = load_known_Interpretations()
+    
+    # 2. Calculate 2025 Events (shared with generate_final_csv.py, cached on disk)
+    print("Calculando Tránsitos 2025...")
+    events = compute_year_events(BIRTH_DT_LOCAL, BIRTH_LAT, BIRTH_LON, 2025)
+    print(f"Total Eventos 2025: {len(events)}")
+    
+    # 3-4. Find Missing and Write CSV
+    write_missing_csv(events, known_titles)
 
 if __name__ == "__main__":
     generate_report()
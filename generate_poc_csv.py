@@ -1,31 +1,30 @@
 
 import csv
-import swisseph as swe
+import numpy as np
+from src.core.ephemeris import ensure_ephe_path
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from src.calculators.poc_vectorized_transits import PocVectorizedTransitsCalculator
 
-# Patch environment for safety (Moshier fallback)
-swe.set_ephe_path('')
+CSV_BUFFER = 1 << 20  # 1 MiB
 
 # Same test data as used in benchmarks
+# Names and longitudes as parallel constants (SoA) instead of a dict-of-dicts
+NATAL_NAMES = ("Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto")
+NATAL_LONS = np.array([
+    275.40, 185.20, 265.1, 240.5, 170.2,
+    10.0, 330.1, 160.5, 230.2, 155.4
+], dtype=np.float64)
+
 NATAL_DATA = {
     "name": "Test User",
-    "points": {
-        "Sun": {"longitude": 275.40}, 
-        "Moon": {"longitude": 185.20}, 
-        "Mercury": {"longitude": 265.1},
-        "Venus": {"longitude": 240.5},
-        "Mars": {"longitude": 170.2},
-        "Jupiter": {"longitude": 10.0}, 
-        "Saturn": {"longitude": 330.1},
-        "Uranus": {"longitude": 160.5},
-        "Neptune": {"longitude": 230.2},
-        "Pluto": {"longitude": 155.4}
-    }
+    "names": NATAL_NAMES,
+    "longitudes": NATAL_LONS
 }
 
 def generate_csv():
+    # Ensure Ephemeris Path (bundled .se1 files instead of the Moshier fallback); idempotent per thread
+    ensure_ephe_path()
     print("Generando eventos para 2025 con POC Vectorizado...")
     calc = PocVectorizedTransitsCalculator(NATAL_DATA)
     start = datetime(2025, 1, 1, tzinfo=ZoneInfo("UTC"))
@@ -34,7 +33,7 @@ def generate_csv():
     events = calc.calculate_all(start, end)
     
     filename = "events_2025_poc.csv"
-    with open(filename, 'w', newline='', encoding='utf-8') as f:
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER) as f:
         writer = csv.writer(f)
         # Header
         writer.writerow([
@@ -47,16 +46,19 @@ def generate_csv():
             "Pos. Natal"
         ])
         
-        for e in events:
-            writer.writerow([
-                e.fecha_utc.strftime("%Y-%m-%d %H:%M:%S"),
+        # isoformat evita el camino de strftime; [:19] descarta el "+00:00" de UTC
+        writer.writerows(
+            (
+                e.fecha_utc.isoformat(sep=' ', timespec='seconds')[:19],
                 e.planeta1,
                 e.tipo_aspecto,
                 e.planeta2,
                 f"{e.orbe:.6f}",
                 f"{e.longitud1:.6f}",
                 f"{e.longitud2:.6f}"
-            ])
+            )
+            for e in events
+        )
             
     print(f"✅ Archivo generado exitosamente: {filename}")
     print(f"Total eventos exportados: {len(events)}")
@@ -1,31 +1,30 @@
 
 import csv
-import swisseph as swe
+import numpy as np
+from src.core.ephemeris import ensure_ephe_path
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from src.calculators.poc_vectorized_transits import PocVectorizedTransitsCalculator
 
-# Patch environment for safety (Moshier fallback)
-swe.set_ephe_path('')
+CSV_BUFFER = 1 << 20  # 1 MiB
 
 # REAL NATAL DATA CALCULATED FOR 26/12/1964 21:12 BUENOS AIRES
+# Names and longitudes as parallel constants (SoA) instead of a dict-of-dicts
+NATAL_NAMES = ("Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto")
+NATAL_LONS = np.array([
+    275.279053, 199.532341, 258.929193, 249.611417, 172.330921,
+    46.462691, 330.848502, 164.826466, 229.183063, 166.312380
+], dtype=np.float64)
+
 NATAL_DATA_REAL = {
     "name": "Maria Blaquier (Real)",
-    "points": {
-        "Sun": {"longitude": 275.279053},
-        "Moon": {"longitude": 199.532341},
-        "Mercury": {"longitude": 258.929193},
-        "Venus": {"longitude": 249.611417},
-        "Mars": {"longitude": 172.330921},
-        "Jupiter": {"longitude": 46.462691},
-        "Saturn": {"longitude": 330.848502},
-        "Uranus": {"longitude": 164.826466},
-        "Neptune": {"longitude": 229.183063},
-        "Pluto": {"longitude": 166.312380},
-    }
+    "names": NATAL_NAMES,
+    "longitudes": NATAL_LONS
 }
 
 def generate_csv():
+    # Ensure Ephemeris Path (bundled .se1 files instead of the Moshier fallback); idempotent per thread
+    ensure_ephe_path()
     print("Generando CSV REAL 2025...")
     calc = PocVectorizedTransitsCalculator(NATAL_DATA_REAL)
     
@@ -36,7 +35,7 @@ def generate_csv():
     events = calc.calculate_all(start, end)
     
     filename = "eventos_2025_real.csv"
-    with open(filename, 'w', newline='', encoding='utf-8') as f:
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER) as f:
         writer = csv.writer(f)
         # Header
         writer.writerow([
@@ -49,16 +48,19 @@ def generate_csv():
             "Pos. Natal"
         ])
         
-        for e in events:
-            writer.writerow([
-                e.fecha_utc.strftime("%Y-%m-%d %H:%M:%S"),
+        # isoformat evita el camino de strftime; [:19] descarta el "+00:00" de UTC
+        writer.writerows(
+            (
+                e.fecha_utc.isoformat(sep=' ', timespec='seconds')[:19],
                 e.planeta1,
                 e.tipo_aspecto,
                 e.planeta2,
                 f"{e.orbe:.6f}",
                 f"{e.longitud1:.6f}",
                 f"{e.longitud2:.6f}"
-            ])
+            )
+            for e in events
+        )
             
     print(f"✅ Archivo generado: {filename}")
     print(f"Total eventos: {len(events)}")
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Genera los reportes CSV de 2025 en una sola ejecución.
+
+  --mode full     eventos_2025_vectorized.csv (todos los eventos)
+  --mode missing  reporte_faltantes_rag.csv (títulos sin interpretación RAG)
+  --mode both     ambos, calculando los tránsitos una sola vez
+"""
+import argparse
+
+from natal_cache import BIRTH_DT_LOCAL, BIRTH_LAT, BIRTH_LON
+from transit_cache import compute_year_events
+from generate_final_csv import write_full_csv
+from generate_missing_rag_csv import load_known_Interpretations, write_missing_csv
+
+def compute_events(year=2025):
+    print(f"Calculando Tránsitos {year} (Motor Vectorial)...")
+    events = compute_year_events(BIRTH_DT_LOCAL, BIRTH_LAT, BIRTH_LON, year)
+    print(f"Eventos encontrados: {len(events)}")
+    return events
+
+def main():
+    parser = argparse.ArgumentParser(description="Reportes CSV de tránsitos 2025")
+    parser.add_argument("--mode", choices=("full", "missing", "both"), default="both")
+    args = parser.parse_args()
+
+    events = compute_events()
+
+    if args.mode in ("full", "both"):
+        write_full_csv(events)
+    if args.mode in ("missing", "both"):
+        write_missing_csv(events, load_known_Interpretations())
+
+if __name__ == "__main__":
+    main()
@@ -2,27 +2,71 @@
 Calendario Astrológico Personalizado v3
 Calcula eventos astrológicos y tránsitos planetarios para un año específico.
 """
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List, Tuple
+import hashlib
+import heapq
 import json
-import pytz
+import operator
+import pickle
+import numpy as np
 import os
 import time
 from pathlib import Path
+from zoneinfo import ZoneInfo
 from src.core import config
 from src.core.location import Location
-from src.core.constants import EventType, AstronomicalConstants
+from src.core.constants import EventType, SIGNOS_BASE
 from src.core.base_event import AstroEvent
 from src.utils.location_utils import create_location_from_place
 from src.calculators.natal_chart import calcular_carta_natal
 from src.calculators.lunar_phases import LunarPhaseCalculator
 from src.calculators.eclipses import EclipseCalculator
+from src.calculators.eclipse_calculator_factory import EclipseCalculatorFactory
 from src.calculators.ingresses import IngressCalculator
 from src.calculators.retrogrades import RetrogradeCalculator
 from src.calculators.nodes import NodeCalculator
+from src.calculators.new_moon_houses import cuspides_absolutas
 from src.calculators.transits_calculator_factory import TransitsCalculatorFactory
+from src.calculators.profections_calculator import ProfectionsCalculator
 from src.output.csv_writer import CSVWriter
 
+# Mapeo de nombres de planetas natales (inglés -> español)
+PLANET_NAMES = {
+    'Sun': 'Sol', 'Moon': 'Luna', 'Mercury': 'Mercurio',
+    'Venus': 'Venus', 'Mars': 'Marte', 'Jupiter': 'Júpiter',
+    'Saturn': 'Saturno', 'Uranus': 'Urano',
+    'Neptune': 'Neptuno', 'Pluto': 'Plutón'
+}
+MAJOR_PLANETS = frozenset(PLANET_NAMES)
+
+# Lunas y eclipses que se anotan con casa natal: (tipo para la descripción, planeta1)
+NATAL_ANNOTATION_LABELS = {
+    EventType.LUNA_NUEVA: ("Luna nueva", "Sol"),
+    EventType.LUNA_LLENA: ("Luna llena", "Luna"),
+    EventType.ECLIPSE_SOLAR: ("Eclipse solar", "Sol"),
+    EventType.ECLIPSE_LUNAR: ("Eclipse lunar", "Luna")
+}
+# Eventos cuya conjunción se mide con la posición del sol (luna + 180°)
+SUN_POSITION_TYPES = frozenset({EventType.LUNA_NUEVA, EventType.ECLIPSE_SOLAR})
+
+_fecha_utc = operator.attrgetter('fecha_utc')
+
+# Caché en disco de los eventos generales (dependen sólo del año y del lugar)
+GENERAL_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache_general')
+# Subir cuando cambien los calculadores generales o los campos de AstroEvent
+GENERAL_CACHE_VERSION = 1
+
+def _merge_por_fecha(streams: List[List[AstroEvent]]) -> List[AstroEvent]:
+    """
+    Une varias listas de eventos en orden cronológico.
+
+    Cada lista se ordena por separado (casi gratis si ya viene ordenada) y luego se
+    mezclan con heapq.merge, que es estable: ante la misma fecha se respeta el orden
+    de las listas, igual que al ordenar la concatenación.
+    """
+    return list(heapq.merge(*(sorted(stream, key=_fecha_utc) for stream in streams), key=_fecha_utc))
+
 class AstronomicalCalendar:
     def __init__(self, year: int, natal_data: dict = None, use_precise_eclipse_calculator: bool = False, 
                  use_immanuel_eclipse_calculator: bool = False, use_parallel_transits_calculator: bool = False, 
@@ -59,7 +103,6 @@ class AstronomicalCalendar:
             
         # Validar la zona horaria obtenida
         try:
-            from zoneinfo import ZoneInfo # Importar aquí para evitar dependencia circular si se mueve Location
             _ = ZoneInfo(self.location.timezone)
             print(f"Timezone '{self.location.timezone}' for location '{self.location.name}' validated successfully.")
         except Exception as e:
@@ -68,12 +111,39 @@ class AstronomicalCalendar:
         self.general_events = []  # Eventos astronómicos generales
         self.personal_events = [] # Eventos personales/natales
 
+        # Posiciones natales y cúspides en grados absolutos (invariantes durante la corrida)
+        self._natal_abs_positions = {}
+        self._house_cusps = None
+        self._house_numbers = None
+        if natal_data and 'points' in natal_data:
+            self._natal_abs_positions = {
+                planet_name: self._convertir_a_grados_absolutos(
+                    data['sign'],
+                    self._parsear_posicion(data['position'])
+                )
+                for planet_name, data in natal_data['points'].items()
+                if planet_name in MAJOR_PLANETS
+            }
+        # Las mismas posiciones como arrays paralelos para el cálculo vectorizado de orbes
+        self._natal_names = list(self._natal_abs_positions)
+        self._natal_abs_arr = np.fromiter(self._natal_abs_positions.values(), dtype=np.float64,
+                                          count=len(self._natal_abs_positions))
+        if natal_data and 'houses' in natal_data:
+            try:
+                cuspides = np.asarray(cuspides_absolutas(natal_data['houses']), dtype=np.float64)
+            except Exception:
+                cuspides = None
+            if cuspides is not None:
+                # Cúspides ordenadas por longitud y el número de casa de cada una
+                orden = np.argsort(cuspides, kind='stable')
+                self._house_cusps = cuspides[orden]
+                self._house_numbers = orden + 1
+
         # Inicializar calculadores
         observer = self.location.create_ephem_observer()
         self.lunar_calculator = LunarPhaseCalculator(observer, self.location.timezone)
         
         # Usar el factory para crear el calculador de eclipses según la preferencia del usuario
-        from src.calculators.eclipse_calculator_factory import EclipseCalculatorFactory
         self.eclipse_calculator = EclipseCalculatorFactory.create_calculator(
             observer, 
             use_precise=self.use_precise_eclipse_calculator,
@@ -90,47 +160,23 @@ class AstronomicalCalendar:
         print(f"\nCalculando eventos astronómicos para {self.year}...")
         start_total = time.time()
         
-        start_date = datetime(self.year, 1, 1, tzinfo=pytz.UTC)
-        end_date = datetime(self.year + 1, 1, 1, tzinfo=pytz.UTC)
+        start_date = datetime(self.year, 1, 1, tzinfo=timezone.utc)
+        end_date = datetime(self.year + 1, 1, 1, tzinfo=timezone.utc)
 
         # Asegurar que existe el directorio de salida
         config.ensure_output_dir()
 
-        # Calcular eventos generales
-        start = time.time()
-        print("\n1/5 Calculando fases lunares...")
-        self.general_events.extend(self.lunar_calculator.calculate_phases(start_date, end_date))
-        print(f"Completado en {time.time() - start:.2f} segundos")
-        
-        start = time.time()
-        print("\n2/5 Calculando eclipses...")
-        if self.use_immanuel_eclipse_calculator:
-            calculator_type = "Immanuel"
-        elif self.use_precise_eclipse_calculator:
-            calculator_type = "de alta precisión"
+        # Eventos generales: de la caché si este año y lugar ya se calcularon
+        cache_path = self._general_cache_path()
+        calculados = self._load_general_cache(cache_path)
+        if calculados is None:
+            calculados = self._calcular_eventos_generales(start_date, end_date)
+            self._save_general_cache(cache_path, calculados)
         else:
-            calculator_type = "estándar"
-        print(f"Usando calculador {calculator_type}")
-        self.general_events.extend(self.eclipse_calculator.calculate_eclipses(start_date, end_date))
-        print(f"Completado en {time.time() - start:.2f} segundos")
-        
-        start = time.time()
-        print("\n3/5 Calculando ingresos...")
-        self.general_events.extend(self.ingress_calculator.calculate_ingresses(start_date, end_date))
-        print(f"Completado en {time.time() - start:.2f} segundos")
-        
-        start = time.time()
-        print("\n4/5 Calculando retrogradaciones...")
-        self.general_events.extend(self.retrograde_calculator.calculate_retrogrades(start_date, end_date))
-        print(f"Completado en {time.time() - start:.2f} segundos")
-        
-        start = time.time()
-        print("\n5/5 Calculando nodos...")
-        self.general_events.extend(self.node_calculator.calculate_node_ingresses(start_date, end_date))
-        print(f"Completado en {time.time() - start:.2f} segundos")
+            print(f"\nEventos generales leídos de la caché ({len(calculados)} eventos)")
 
         # Ordenar eventos generales por fecha
-        self.general_events.sort(key=lambda x: x.fecha_utc)
+        self.general_events = _merge_por_fecha([self.general_events, calculados])
 
         # Si hay datos natales, calcular eventos personales
         if self.natal_data and 'name' in self.natal_data:
@@ -138,12 +184,14 @@ class AstronomicalCalendar:
             
             # Contador para la numeración de pasos
             step_count = 1
-            total_steps = 3  # Base: tránsitos, lunas, eclipses
+            total_steps = 2  # Base: tránsitos, casas de lunas y eclipses
             if self.calculate_progressed_moon:
                 total_steps += 1
             if self.calculate_profections:
                 total_steps += 1
             
+            personal_streams = []
+
             # Calcular tránsitos
             start = time.time()
             print(f"\n{step_count}/{total_steps} Calculando tránsitos...")
@@ -169,7 +217,7 @@ class AstronomicalCalendar:
                 use_parallel=self.use_parallel_transits_calculator,
                 timezone_str=self.location.timezone # Pass timezone here
             )
-            self.personal_events.extend(transits_calculator.calculate_all(start_date, end_date))
+            personal_streams.append(transits_calculator.calculate_all(start_date, end_date))
             print(f"Completado en {time.time() - start:.2f} segundos")
             
             # Calcular conjunciones de Luna progresada si se solicitó
@@ -181,7 +229,7 @@ class AstronomicalCalendar:
                     self.natal_data,
                     calculator_type="progressed_moon"
                 )
-                self.personal_events.extend(progressed_calculator.calculate_all(start_date, end_date))
+                personal_streams.append(progressed_calculator.calculate_all(start_date, end_date))
                 print(f"Completado en {time.time() - start:.2f} segundos")
             
             # Calcular profecciones anuales si se solicitó
@@ -189,45 +237,96 @@ class AstronomicalCalendar:
                 start = time.time()
                 print(f"\n{step_count}/{total_steps} Calculando profecciones anuales...")
                 step_count += 1
-                from src.calculators.profections_calculator import ProfectionsCalculator
                 profections_calculator = ProfectionsCalculator(self.natal_data)
                 
                 # Mostrar información detallada en consola
                 print("\nInformación de profección para el año actual:")
-                year_start = datetime(self.year, 1, 1, tzinfo=pytz.UTC)
+                year_start = datetime(self.year, 1, 1, tzinfo=timezone.utc)
                 profections_calculator.display_profection_info(year_start)
                 
                 # Calcular eventos para el CSV
-                self.personal_events.extend(profections_calculator.calculate_profection_events(start_date, end_date))
+                personal_streams.append(profections_calculator.calculate_profection_events(start_date, end_date))
                 print(f"Completado en {time.time() - start:.2f} segundos")
             
-            # Agregar información de casas para lunas
-            print(f"\n{step_count}/{total_steps} Agregando información de casas para lunas...")
-            step_count += 1
-            self._add_moon_phase_house_events()
-            
-            # Agregar información de casas para eclipses
-            print(f"\n{step_count}/{total_steps} Agregando información de casas para eclipses...")
-            self._add_eclipse_house_events()
+            # Agregar información de casas para lunas y eclipses (una sola pasada)
+            print(f"\n{step_count}/{total_steps} Agregando información de casas para lunas y eclipses...")
+            self._annotate_natal_events()
 
-            # Ordenar eventos personales por fecha
-            self.personal_events.sort(key=lambda x: x.fecha_utc)
+            # Ordenar eventos personales por fecha (las lunas y eclipses anotados,
+            # agregados a self.personal_events, van al final como antes)
+            personal_streams.append(self.personal_events)
+            self.personal_events = _merge_por_fecha(personal_streams)
+
+    def _general_cache_path(self) -> str:
+        """Archivo de caché de los eventos generales para este año, lugar y calculador de eclipses"""
+        key = (f"v{GENERAL_CACHE_VERSION}|{self.year}|{round(self.location.lat, 3)}|"
+               f"{round(self.location.lon, 3)}|{self.location.elevation}|{self.location.timezone}|"
+               f"{self.use_precise_eclipse_calculator}|{self.use_immanuel_eclipse_calculator}")
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()
+        return os.path.join(GENERAL_CACHE_DIR, f"general_events_{self.year}_{digest}.pkl")
+
+    def _load_general_cache(self, path: str) -> Optional[List[AstroEvent]]:
+        """Lee los eventos generales de la caché (None si no existe o no se puede leer)"""
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Caché de eventos generales ilegible, se recalcula: {e}")
+            return None
+
+    def _save_general_cache(self, path: str, events: List[AstroEvent]):
+        """Guarda los eventos generales en la caché"""
+        try:
+            os.makedirs(GENERAL_CACHE_DIR, exist_ok=True)
+            with open(path, 'wb') as f:
+                pickle.dump(events, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"No se pudo guardar la caché de eventos generales: {e}")
+
+    def _calcular_eventos_generales(self, start_date: datetime, end_date: datetime) -> List[AstroEvent]:
+        """Calcula fases lunares, eclipses, ingresos, retrogradaciones y nodos del año"""
+        # Calcular eventos generales (una lista por calculador, cada una en orden cronológico)
+        general_streams = []
+        start = time.time()
+        print("\n1/5 Calculando fases lunares...")
+        general_streams.append(self.lunar_calculator.calculate_phases(start_date, end_date))
+        print(f"Completado en {time.time() - start:.2f} segundos")
+        
+        start = time.time()
+        print("\n2/5 Calculando eclipses...")
+        if self.use_immanuel_eclipse_calculator:
+            calculator_type = "Immanuel"
+        elif self.use_precise_eclipse_calculator:
+            calculator_type = "de alta precisión"
+        else:
+            calculator_type = "estándar"
+        print(f"Usando calculador {calculator_type}")
+        general_streams.append(self.eclipse_calculator.calculate_eclipses(start_date, end_date))
+        print(f"Completado en {time.time() - start:.2f} segundos")
+        
+        start = time.time()
+        print("\n3/5 Calculando ingresos...")
+        general_streams.append(self.ingress_calculator.calculate_ingresses(start_date, end_date))
+        print(f"Completado en {time.time() - start:.2f} segundos")
+        
+        start = time.time()
+        print("\n4/5 Calculando retrogradaciones...")
+        general_streams.append(self.retrograde_calculator.calculate_retrogrades(start_date, end_date))
+        print(f"Completado en {time.time() - start:.2f} segundos")
+        
+        start = time.time()
+        print("\n5/5 Calculando nodos...")
+        general_streams.append(self.node_calculator.calculate_node_ingresses(start_date, end_date))
+        print(f"Completado en {time.time() - start:.2f} segundos")
+
+        return _merge_por_fecha(general_streams)
 
     def _convertir_a_grados_absolutos(self, signo: str, grado: float, desde_ingles: bool = True) -> float:
         """
         Convierte una posición zodiacal (signo y grado) a grados absolutos (0-360).
         """
-        # Mapeo de signos a su posición base (0-330)
-        SIGNOS_BASE = {
-            # Inglés
-            'Aries': 0, 'Taurus': 30, 'Gemini': 60, 'Cancer': 90,
-            'Leo': 120, 'Virgo': 150, 'Libra': 180, 'Scorpio': 210,
-            'Sagittarius': 240, 'Capricorn': 270, 'Aquarius': 300, 'Pisces': 330,
-            # Español
-            'Aries': 0, 'Tauro': 30, 'Géminis': 60, 'Cáncer': 90,
-            'Leo': 120, 'Virgo': 150, 'Libra': 180, 'Escorpio': 210,
-            'Sagitario': 240, 'Capricornio': 270, 'Acuario': 300, 'Piscis': 330
-        }
         return SIGNOS_BASE[signo] + grado
 
     def _parsear_posicion(self, posicion: str) -> float:
@@ -240,154 +339,92 @@ class AstronomicalCalendar:
         segundos = float(partes[2]) if len(partes) > 2 else 0
         return grados + minutos/60 + segundos/3600
 
-    def _calcular_orbe(self, pos1: float, pos2: float) -> float:
+    def _natal_conjunction_hits(self, positions: List[float], max_orb: float = 4.0) -> Dict[int, List[Tuple[int, float]]]:
         """
-        Calcula el orbe más corto entre dos posiciones zodiacales.
+        Busca conjunciones entre varias posiciones y los planetas natales en una sola operación.
+
+        Returns:
+            Dict {índice de posición: [(índice de planeta natal, orbe), ...]} sólo para las
+            posiciones con al menos un planeta natal dentro del orbe
         """
-        diff = abs(pos1 - pos2)
-        if diff > 180:
-            diff = 360 - diff
-        return diff
-
-    def _add_moon_phase_house_events(self):
-        """Agrega información de casas natales y conjunciones a eventos de lunas"""
-        for event in self.general_events:
-            if event.tipo_evento in [EventType.LUNA_NUEVA, EventType.LUNA_LLENA]:
-                # Crear copia del evento con información natal
-                natal_event = AstroEvent(
+        # Matriz (posiciones x planetas) del orbe más corto
+        diff = np.abs(np.asarray(positions, dtype=np.float64)[:, None] - self._natal_abs_arr)
+        orbs = np.minimum(diff, 360.0 - diff)
+        rows, cols = np.nonzero(orbs <= max_orb)
+        hits = {}
+        for row, col, orb in zip(rows.tolist(), cols.tolist(), orbs[rows, cols].tolist()):
+            hits.setdefault(row, []).append((col, orb))
+        return hits
+
+    def _annotate_natal_events(self):
+        """Agrega información de casas natales y conjunciones a eventos de lunas y eclipses"""
+        events = [event for event in self.general_events if event.tipo_evento in NATAL_ANNOTATION_LABELS]
+        # Sin lunas/eclipses, o sin planetas natales ni casas, no hay nada que anotar
+        if not events or (not self._natal_abs_positions and self._house_cusps is None):
+            return
+
+        # Para luna llena / eclipse lunar usamos la posición de la luna; para luna nueva /
+        # eclipse solar, la posición del sol (la de la luna + 180°)
+        positions = [
+            (event.longitud1 + 180) % 360 if event.tipo_evento in SUN_POSITION_TYPES else event.longitud1
+            for event in events
+        ]
+        # Conjunciones con planetas natales (orbe de 4°) y casas natales para todos los eventos a la vez
+        hits = self._natal_conjunction_hits(positions) if self._natal_abs_positions else {}
+        casas = self._determinar_casas_natales([event.longitud1 for event in events])
+
+        # Los eventos nuevos se juntan en una lista local y se agregan de una vez al final
+        nuevos = []
+        for i, event in enumerate(events):
+            # Casa natal: la copia sólo se crea si va al CSV personal. El evento general
+            # no se modifica porque el CSV general no lleva casas natales.
+            casa = casas[i]
+            if casa:
+                nuevos.append(AstroEvent(
                     fecha_utc=event.fecha_utc,
                     tipo_evento=event.tipo_evento,
-                    descripcion=event.descripcion,
+                    descripcion=f"{event.descripcion} en Casa {casa}",
                     signo=event.signo,
                     grado=event.grado,
                     longitud1=event.longitud1,
+                    casa_natal=casa,
                     timezone_str=self.location.timezone  # Usar la zona horaria del usuario
-                )
-                
-                # Calcular casa natal
-                casa = self._determinar_casa_natal(event.longitud1)
-                if casa:
-                    natal_event.casa_natal = casa
-                    natal_event.descripcion += f" en Casa {casa}"
-                    self.personal_events.append(natal_event)
-                
-                # Verificar conjunciones con planetas natales
-                # Para luna llena usamos la posición de la luna, para luna nueva la posición del sol
-                pos = event.longitud1
-                if event.tipo_evento == EventType.LUNA_NUEVA:
-                    # Para luna nueva, sumar 180° a la posición de la luna para obtener la posición del sol
-                    pos = (pos + 180) % 360
-                
-                for planet_name, data in self.natal_data['points'].items():
-                    if planet_name in ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 
-                                     'Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto']:
-                        planet_pos = self._convertir_a_grados_absolutos(
-                            data['sign'],
-                            self._parsear_posicion(data['position'])
-                        )
-                        orb = self._calcular_orbe(pos, planet_pos)
-                        
-                        if orb <= 4.0:  # Orbe de 4°
-                            # Mapeo de nombres de planetas
-                            PLANET_NAMES = {
-                                'Sun': 'Sol', 'Moon': 'Luna', 'Mercury': 'Mercurio',
-                                'Venus': 'Venus', 'Mars': 'Marte', 'Jupiter': 'Júpiter',
-                                'Saturn': 'Saturno', 'Uranus': 'Urano',
-                                'Neptune': 'Neptuno', 'Pluto': 'Plutón'
-                            }
-                            
-                            # Crear evento para la conjunción
-                            tipo = "Luna llena" if event.tipo_evento == EventType.LUNA_LLENA else "Luna nueva"
-                            planeta1 = "Luna" if event.tipo_evento == EventType.LUNA_LLENA else "Sol"
-                            grado = event.grado
-                            conj_event = AstroEvent(
-                                fecha_utc=event.fecha_utc,
-                                tipo_evento=EventType.ASPECTO,
-                                descripcion=f"{tipo} en {event.signo} {AstroEvent.format_degree(grado)} en conjunción con {PLANET_NAMES[planet_name]} natal",
-                                planeta1=planeta1,
-                                planeta2=PLANET_NAMES[planet_name],
-                                longitud1=pos,
-                                longitud2=planet_pos,
-                                tipo_aspecto="Conjunción",
-                                orbe=orb,
-                                timezone_str=self.location.timezone  # Usar la zona horaria del usuario
-                            )
-                            self.personal_events.append(conj_event)
-
-    def _add_eclipse_house_events(self):
-        """Agrega información de casas natales y conjunciones a eventos de eclipses"""
-        for event in self.general_events:
-            if event.tipo_evento in [EventType.ECLIPSE_SOLAR, EventType.ECLIPSE_LUNAR]:
-                # Crear copia del evento con información natal
-                natal_event = AstroEvent(
+                ))
+            
+            event_hits = hits.get(i)
+            if not event_hits:
+                continue
+            pos = positions[i]
+            tipo, planeta1 = NATAL_ANNOTATION_LABELS[event.tipo_evento]
+            # La parte de la descripción que no depende del planeta natal, una vez por evento
+            prefijo = f"{tipo} en {event.signo} {AstroEvent.format_degree(event.grado)} en conjunción con "
+            for planet_idx, orb in event_hits:
+                planet_name = self._natal_names[planet_idx]
+                # Crear evento para la conjunción
+                conj_event = AstroEvent(
                     fecha_utc=event.fecha_utc,
-                    tipo_evento=event.tipo_evento,
-                    descripcion=event.descripcion,
-                    signo=event.signo,
-                    grado=event.grado,
-                    longitud1=event.longitud1,
+                    tipo_evento=EventType.ASPECTO,
+                    descripcion=prefijo + PLANET_NAMES[planet_name] + " natal",
+                    planeta1=planeta1,
+                    planeta2=PLANET_NAMES[planet_name],
+                    longitud1=pos,
+                    longitud2=self._natal_abs_positions[planet_name],
+                    tipo_aspecto="Conjunción",
+                    orbe=orb,
                     timezone_str=self.location.timezone  # Usar la zona horaria del usuario
                 )
-                
-                # Calcular casa natal
-                casa = self._determinar_casa_natal(event.longitud1)
-                if casa:
-                    natal_event.casa_natal = casa
-                    natal_event.descripcion += f" en Casa {casa}"
-                    self.personal_events.append(natal_event)
-                
-                # Verificar conjunciones con planetas natales
-                # Para eclipse lunar usamos la posición de la luna, para eclipse solar la posición del sol
-                pos = event.longitud1
-                if event.tipo_evento == EventType.ECLIPSE_SOLAR:
-                    # Para eclipse solar, sumar 180° a la posición de la luna para obtener la posición del sol
-                    pos = (pos + 180) % 360
-                
-                for planet_name, data in self.natal_data['points'].items():
-                    if planet_name in ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 
-                                     'Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto']:
-                        planet_pos = self._convertir_a_grados_absolutos(
-                            data['sign'],
-                            self._parsear_posicion(data['position'])
-                        )
-                        orb = self._calcular_orbe(pos, planet_pos)
-                        
-                        if orb <= 4.0:  # Orbe de 4°
-                            # Mapeo de nombres de planetas
-                            PLANET_NAMES = {
-                                'Sun': 'Sol', 'Moon': 'Luna', 'Mercury': 'Mercurio',
-                                'Venus': 'Venus', 'Mars': 'Marte', 'Jupiter': 'Júpiter',
-                                'Saturn': 'Saturno', 'Uranus': 'Urano',
-                                'Neptune': 'Neptuno', 'Pluto': 'Plutón'
-                            }
-                            
-                            # Crear evento para la conjunción
-                            tipo = "Eclipse lunar" if event.tipo_evento == EventType.ECLIPSE_LUNAR else "Eclipse solar"
-                            planeta1 = "Luna" if event.tipo_evento == EventType.ECLIPSE_LUNAR else "Sol"
-                            grado = event.grado
-                            conj_event = AstroEvent(
-                                fecha_utc=event.fecha_utc,
-                                tipo_evento=EventType.ASPECTO,
-                                descripcion=f"{tipo} en {event.signo} {AstroEvent.format_degree(grado)} en conjunción con {PLANET_NAMES[planet_name]} natal",
-                                planeta1=planeta1,
-                                planeta2=PLANET_NAMES[planet_name],
-                                longitud1=pos,
-                                longitud2=planet_pos,
-                                tipo_aspecto="Conjunción",
-                                orbe=orb,
-                                timezone_str=self.location.timezone  # Usar la zona horaria del usuario
-                            )
-                            self.personal_events.append(conj_event)
-
-    def _determinar_casa_natal(self, longitud: float) -> Optional[int]:
-        """Determina la casa natal para una posición zodiacal"""
-        from src.calculators.new_moon_houses import determinar_casa_natal
-        signo = AstronomicalConstants.get_sign_name(longitud)
-        grado = longitud % 30
-        try:
-            return determinar_casa_natal(signo, grado, self.natal_data['houses'], debug=False)
-        except Exception:
-            return None
+                nuevos.append(conj_event)
+
+        self.personal_events.extend(nuevos)
+
+    def _determinar_casas_natales(self, longitudes: List[float]) -> List[Optional[int]]:
+        """Determina la casa natal de cada posición zodiacal (None si no hay casas natales)"""
+        if self._house_cusps is None:
+            return [None] * len(longitudes)
+        # La casa es la de la última cúspide <= posición; antes de la primera cúspide
+        # (índice -1) es la casa que cruza 0°
+        idx = np.searchsorted(self._house_cusps, longitudes, side='right') - 1
+        return self._house_numbers[idx].tolist()
 
     def save_to_csv(self) -> tuple[str, Optional[str]]:
         """
@@ -407,24 +444,16 @@ class AstronomicalCalendar:
             # La lista self.personal_events ya contiene los eventos filtrados
             # (si se usó V4) o todos los eventos (si se usaron otros calculadores).
             # El filtrado de Aspectos "Exacto"/"Estacionario" ahora se hace DENTRO de V4.
-            # Simplemente preparamos los eventos para el CSV writer.
-            
-            events_to_write = []
-            for event in self.personal_events:
-                 # Crear una copia o modificar directamente si es seguro
-                 # Eliminar campos no deseados antes de escribir
-                 event.elevacion = None
-                 event.azimut = None
-                 events_to_write.append(event)
-
-            print(f"Total de eventos personales a escribir: {len(events_to_write)}")
+            # Ningún calculador personal completa elevación ni azimut (sólo las fases
+            # lunares, eclipses y nodos generales), así que se escriben tal cual.
+            print(f"Total de eventos personales a escribir: {len(self.personal_events)}")
             
             personal_filename = config.get_personal_events_filename(
                 self.natal_data['name'], 
                 self.year
             )
             # Escribir los eventos personales (ya filtrados por V4 si aplica)
-            CSVWriter.write_events(events_to_write, personal_filename)
+            CSVWriter.write_events(self.personal_events, personal_filename)
         
         return general_filename, personal_filename
 
@@ -506,8 +535,7 @@ def main():
             print("\nPosiciones Planetarias:")
             print("-" * 30)
             for planeta, datos in natal_data['points'].items():
-                if planeta in ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 
-                             'Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto']:
+                if planeta in MAJOR_PLANETS:
                     retro = " (R)" if datos.get('retrograde') else ""
                     print(f"{planeta:8}: {datos['sign']} {datos['position']}{retro}")
             
@@ -0,0 +1,86 @@
+"""
+Carta natal compartida por los generadores de CSV (generate_*_csv.py).
+
+Las posiciones natales se calculan una sola vez y se guardan en un JSON junto a
+este módulo; las ejecuciones siguientes las leen de ahí sin volver a abrir los
+archivos de Swiss Ephemeris.
+"""
+import json
+import os
+from datetime import datetime
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import swisseph as swe
+
+from src.core.ephemeris import ensure_ephe_path
+from src.utils.swe_batch import calc_bodies
+
+# Carta natal de referencia de los reportes (26/12/1964 21:12 Buenos Aires)
+BIRTH_DT_LOCAL = datetime(1964, 12, 26, 21, 12, tzinfo=ZoneInfo("America/Argentina/Buenos_Aires"))
+BIRTH_LAT = -34.6037
+BIRTH_LON = -58.3816
+
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'natal_cache.json')
+
+PLANET_MAP = {
+    0: "Sun", 1: "Moon", 2: "Mercury", 3: "Venus", 4: "Mars",
+    5: "Jupiter", 6: "Saturn", 7: "Uranus", 8: "Neptune", 9: "Pluto"
+}
+NATAL_NAMES = np.array(list(PLANET_MAP.values()), dtype=object)
+# Sólo se lee la longitud: sin FLG_SPEED, Swiss Ephemeris no calcula velocidades
+NATAL_FLAGS = swe.FLG_SWIEPH
+
+def _load_sidecar() -> dict:
+    try:
+        with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+@lru_cache(maxsize=None)
+def _natal_longitudes(birth_iso: str, lat: float, lon: float) -> tuple:
+    # El path de efemérides forma parte de la clave: Moshier y los .se1 difieren
+    key = f"{birth_iso}|{lat}|{lon}|{ensure_ephe_path()}|{NATAL_FLAGS}"
+    cache = _load_sidecar()
+    if key in cache:
+        return tuple(cache[key][name] for name in PLANET_MAP.values())
+
+    birth_dt_utc = datetime.fromisoformat(birth_iso).astimezone(ZoneInfo("UTC"))
+    jd_birth = swe.julday(birth_dt_utc.year, birth_dt_utc.month, birth_dt_utc.day,
+                          birth_dt_utc.hour + birth_dt_utc.minute/60.0 + birth_dt_utc.second/3600.0)
+
+    # Los 10 planetas en una sola pasada; el dict se arma sólo para el sidecar
+    pids = np.fromiter(PLANET_MAP.keys(), dtype=int)
+    longitudes = calc_bodies(jd_birth, pids, NATAL_FLAGS)[:, 0]
+
+    cache[key] = dict(zip(PLANET_MAP.values(), longitudes.tolist()))
+    with open(CACHE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+
+    return tuple(longitudes.tolist())
+
+def compute_natal(birth_dt_local: datetime, lat: float, lon: float) -> dict:
+    """
+    Devuelve los datos natales (Sol a Plutón) en el formato que esperan los calculadores.
+
+    Args:
+        birth_dt_local: Fecha y hora de nacimiento con zona horaria
+        lat: Latitud del lugar de nacimiento
+        lon: Longitud del lugar de nacimiento
+
+    Returns:
+        Dict SoA con 'names', 'longitudes' (float64, mismo orden) y 'location'
+        (una copia nueva en cada llamada)
+    """
+    longitudes = _natal_longitudes(birth_dt_local.isoformat(), lat, lon)
+    return {
+        'names': NATAL_NAMES,
+        'longitudes': np.array(longitudes, dtype=np.float64),
+        'location': {
+            'latitude': lat,
+            'longitude': lon,
+            'timezone': str(birth_dt_local.tzinfo)
+        }
+    }
@@ -1,18 +1,26 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+from pydantic import BaseModel
 from src.api.schemas import (
     BirthDataRequest, 
     NatalDataRequest, 
     CalculationResponse
 )
 from src.api.schemas_strict import CalculationResponseStrict
-from src.services.calendar_service import (
-    calculate_calendar_dynamic,
-    calculate_calendar_legacy,
-    calculate_calendar_dynamic_strict
-)
+
+# The service modules pull in swisseph, immanuel and numpy. They are imported inside
+# the endpoints so that importing the app (and mounting this router) stays cheap.
 
 router = APIRouter()
 
+def _json_response(result: BaseModel) -> Response:
+    """
+    Serialize an already-validated response model straight to JSON bytes.
+    Returning a Response skips FastAPI's response_model pass, which would dump
+    the model to dicts, validate every event again and then json.dumps it.
+    response_model is kept on the routes for the OpenAPI schema.
+    """
+    return Response(content=result.model_dump_json(), media_type="application/json")
+
 @router.post("/calculate-personal-calendar-dynamic", response_model=CalculationResponseStrict)
 async def calculate_personal_calendar_dynamic_endpoint(request: BirthDataRequest):
     """
@@ -20,7 +28,8 @@ async def calculate_personal_calendar_dynamic_endpoint(request: BirthDataRequest
     This endpoint receives basic birth data and calculates the complete natal chart dynamically.
     Returns Strict Types (datetime, etc).
     """
-    return await calculate_calendar_dynamic_strict(request)
+    from src.services.calendar_service import calculate_calendar_dynamic_strict
+    return _json_response(await calculate_calendar_dynamic_strict(request))
 
 @router.post("/calculate-personal-calendar", response_model=CalculationResponse)
 async def calculate_personal_calendar_endpoint(request: NatalDataRequest):
@@ -28,4 +37,5 @@ async def calculate_personal_calendar_endpoint(request: NatalDataRequest):
     Legacy endpoint: Calculate personal astrological calendar events using pre-calculated natal chart.
     This endpoint receives a complete natal chart and uses it for calculations.
     """
-    return await calculate_calendar_legacy(request)
+    from src.services.calendar_service import calculate_calendar_legacy
+    return _json_response(await calculate_calendar_legacy(request))
@@ -1,10 +1,11 @@
 from fastapi import APIRouter, HTTPException
-from datetime import datetime
 from src.api.schemas import (
     CycleAnalysisRequest, 
     ActiveCyclesResponse
 )
-from src.services.cycles_service import get_active_cycles
+
+# cycles_service pulls in the ephemeris stack; it is imported inside the endpoint
+# so that importing the app (and mounting this router) stays cheap.
 
 router = APIRouter()
 
@@ -16,15 +17,14 @@ async def calculate_cycles_endpoint(request: CycleAnalysisRequest):
     and returns the full 27-month cycle timeline.
     Also calculates Metonic Index based on birth date.
     """
+    from src.services.cycles_service import get_active_cycles
+
+    # Dates arrive already parsed by CycleAnalysisRequest (invalid ones get a 422)
     try:
-        target_dt = datetime.fromisoformat(request.target_date)
-        birth_dt = datetime.fromisoformat(request.birth_date)
-        
-        # Calculate
         return get_active_cycles(
-            target_date=target_dt,
+            target_date=request.target_date,
             location_data=request.location,
-            birth_date=birth_dt
+            birth_date=request.birth_date
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
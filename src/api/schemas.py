@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+from datetime import datetime
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Dict, Any, Optional
 
 # Pydantic models for request/response
@@ -84,10 +85,19 @@ class InfoResponse(BaseModel):
     features: List[str]
 
 class CycleAnalysisRequest(BaseModel):
-    birth_date: str = Field(description="Birth date in YYYY-MM-DD format")
-    target_date: str = Field(description="Date to check for active cycles (YYYY-MM-DD)")
+    birth_date: datetime = Field(description="Birth date in YYYY-MM-DD format")
+    target_date: datetime = Field(description="Date to check for active cycles (YYYY-MM-DD)")
     location: LocationData
 
+    @field_validator("birth_date", "target_date", mode="before")
+    @classmethod
+    def _parse_iso_date(cls, value):
+        # Same formats the route accepted before (datetime.fromisoformat). Pydantic's own
+        # parser would read a compact date like "20250101" as a unix timestamp.
+        if isinstance(value, str):
+            return datetime.fromisoformat(value)
+        return value
+
 class CyclePhaseResponse(BaseModel):
     date: str
     phase: str # New Moon, First Quarter, etc.
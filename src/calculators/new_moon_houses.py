@@ -112,6 +112,53 @@ def _parsear_posicion(posicion: str) -> float:
     segundos = float(partes[2]) if len(partes) > 2 else 0
     return grados + minutos/60 + segundos/3600
 
+def cuspides_absolutas(casas: dict) -> list:
+    """
+    Convierte las cúspides de las casas natales a grados absolutos.
+
+    Args:
+        casas: Diccionario con los datos de las casas natales (signo en inglés)
+
+    Returns:
+        Lista de 12 longitudes absolutas, en el orden de las casas 1 a 12
+    """
+    casas_abs = {}
+    for num, datos in casas.items():
+        casas_abs[int(num)] = _convertir_a_grados_absolutos(
+            datos['sign'],
+            _parsear_posicion(datos['position']),
+            desde_ingles=True  # Las casas vienen en inglés del JSON
+        )
+    return [casas_abs[i] for i in range(1, 13)]
+
+def casa_de_posicion(pos: float, cuspides: list) -> int:
+    """
+    Determina la casa (1-12) en la que cae una longitud absoluta.
+
+    Args:
+        pos: Longitud absoluta (0-360)
+        cuspides: Cúspides en grados absolutos, como las devuelve cuspides_absolutas
+
+    Returns:
+        Número de la casa natal (1-12)
+    """
+    # Para cada casa, determinar si el punto está entre su inicio y el inicio de la siguiente
+    for i in range(12):
+        inicio = cuspides[i]
+        fin = cuspides[(i + 1) % 12]
+        
+        # Si la casa cruza 0°
+        if fin < inicio:
+            # Si la posición está después del inicio o antes del fin
+            if pos >= inicio or pos < fin:
+                return i + 1
+        # Caso normal
+        elif inicio <= pos < fin:
+            return i + 1
+    
+    # Si no se encontró (no debería ocurrir)
+    raise ValueError(f"No se pudo determinar la casa para {pos}°")
+
 def determinar_casa_natal(signo: str, grado: float, casas: dict, debug: bool = False) -> int:
     """
     Determina en qué casa natal cae una posición zodiacal.
@@ -134,44 +181,16 @@ def determinar_casa_natal(signo: str, grado: float, casas: dict, debug: bool = F
         print(f"Posición absoluta de la luna: {pos_luna}°")
     
     # Convertir posiciones de las casas a grados absolutos
-    casas_abs = {}
-    for num, datos in casas.items():
-        pos_abs = _convertir_a_grados_absolutos(
-            datos['sign'],
-            _parsear_posicion(datos['position']),
-            desde_ingles=True  # Las casas vienen en inglés del JSON
-        )
-        casas_abs[int(num)] = pos_abs
-        if debug:
-            print(f"Casa {num}: {datos['sign']} {datos['position']} -> {pos_abs}°")
+    cuspides = cuspides_absolutas(casas)
     
     if debug:
+        for num, datos in casas.items():
+            print(f"Casa {num}: {datos['sign']} {datos['position']} -> {cuspides[int(num) - 1]}°")
         print("\nComparando con límites de casas:")
-    # Mantener el orden original de las casas (1-12)
-    casas_ordenadas = [(i, casas_abs[i]) for i in range(1, 13)]
-    if debug:
-        for i in range(len(casas_ordenadas)):
-            casa_actual = casas_ordenadas[i]
-            casa_siguiente = casas_ordenadas[(i + 1) % 12]
-            print(f"Casa {casa_actual[0]}: {casa_actual[1]}° -> Casa {casa_siguiente[0]}: {casa_siguiente[1]}°")
+        for i in range(12):
+            print(f"Casa {i + 1}: {cuspides[i]}° -> Casa {(i + 1) % 12 + 1}: {cuspides[(i + 1) % 12]}°")
     
-    # Para cada casa, determinar si el punto está entre su inicio y el inicio de la siguiente
-    pos_luna_norm = pos_luna
-    for i in range(len(casas_ordenadas)):
-        casa_actual = casas_ordenadas[i]
-        casa_siguiente = casas_ordenadas[(i + 1) % 12]
-        
-        inicio = casa_actual[1]
-        fin = casa_siguiente[1]
-        
-        # Si la casa cruza 0°
-        if fin < inicio:
-            # Si la posición está después del inicio o antes del fin
-            if pos_luna >= inicio or pos_luna < fin:
-                return casa_actual[0]
-        # Caso normal
-        elif inicio <= pos_luna < fin:
-            return casa_actual[0]
-    
-    # Si no se encontró (no debería ocurrir)
-    raise ValueError(f"No se pudo determinar la casa para {signo} {grado}°")
+    try:
+        return casa_de_posicion(pos_luna, cuspides)
+    except ValueError:
+        raise ValueError(f"No se pudo determinar la casa para {signo} {grado}°")
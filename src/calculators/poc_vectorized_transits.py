@@ -45,10 +45,15 @@ class PocVectorizedTransitsCalculator:
     def __init__(self, natal_data: dict):
         self.natal_data = natal_data
         self.natal_positions = {}
-        for pname, data in natal_data['points'].items():
+        # SoA layout ('names' + 'longitudes' arrays) or the classic 'points' dict
+        if 'longitudes' in natal_data:
+            pairs = zip(natal_data['names'], natal_data['longitudes'].tolist())
+        else:
+            pairs = ((pname, data['longitude']) for pname, data in natal_data['points'].items())
+        for pname, lon in pairs:
             pid = getattr(chart, pname.upper(), None)
             if pid is not None:
-                self.natal_positions[pid] = data['longitude']
+                self.natal_positions[pid] = lon
     
     def calculate_all(self, start_date: datetime, end_date: datetime) -> List[AstroEvent]:
         # 1. Ephemeris Pre-calculation (The "Heavy Lift")
@@ -78,75 +83,79 @@ class PocVectorizedTransitsCalculator:
         events = []
         
         # 2. Vectorized Search
+        # Flatten every (natal point, aspect) pair into one target array so each
+        # transiting planet is scanned against all targets in a single NumPy pass.
+        pairs = [
+            (natal_pid, natal_lon, asp_name, (natal_lon + asp_angle) % 360)
+            for natal_pid, natal_lon in self.natal_positions.items()
+            for asp_name, asp_angle in POC_ASPECTS.items()
+        ]
+        targets = np.array([pair[3] for pair in pairs])
+        
         for i, transit_pid in enumerate(POC_PLANETS):
             transit_lons = curr_positions[i]
             
-            for natal_pid, natal_lon in self.natal_positions.items():
-                for asp_name, asp_angle in POC_ASPECTS.items():
-                    # Calculate difference relative to aspect
-                    # We want: abs(Transit - Natal - Aspect) ≈ 0
-                    # Handling 360 wrap-around is tricky in vectorization, 
-                    # so we look for crossing of (Target)
-                    
-                    target = (natal_lon + asp_angle) % 360
-                    
-                    # Normalize diff to [-180, 180] 
-                    diffs = (transit_lons - target + 180) % 360 - 180
-                    
-                    # Manual Zero-Crossing Detection with Wrap-around protection
-                    # We look for sign changes where the jump is SMALL (not wrapping 360 deg)
-                    
-                    # diffs[:-1] * diffs[1:] < 0  checks for sign change
-                    # abs(diffs[:-1] - diffs[1:]) < 180 checks that we didn't jump across the cut
-                    
-                    candidates = (diffs[:-1] * diffs[1:] <= 0) & (np.abs(diffs[:-1] - diffs[1:]) < 180)
-                    
-                    # DEBUG PRINT FOR SUN
-                    if i == 0 and natal_pid == chart.SUN and asp_name == "Conjunción":
-                       print(f"DEBUG SUN CONJUNCTION SUN:")
-                       print(f"Natal: {natal_lon}, Target: {target}")
-                       print(f"Transit Lon [0]: {transit_lons[0]}")
-                       print(f"Diff [0]: {diffs[0]}")
-                       print(f"Candidates found: {np.sum(candidates)}")
-                    
-                    day_indices = np.where(candidates)[0]
+            # Calculate difference relative to aspect
+            # We want: abs(Transit - Natal - Aspect) ≈ 0
+            # Handling 360 wrap-around is tricky in vectorization, 
+            # so we look for crossing of (Target)
+            # Normalize diff to [-180, 180]. Shape: (NumTargets, NumDays)
+            diffs = (transit_lons[np.newaxis, :] - targets[:, np.newaxis] + 180) % 360 - 180
+            
+            # Manual Zero-Crossing Detection with Wrap-around protection
+            # We look for sign changes where the jump is SMALL (not wrapping 360 deg)
+            
+            # diffs[:, :-1] * diffs[:, 1:] < 0  checks for sign change
+            # abs(diffs[:, :-1] - diffs[:, 1:]) < 180 checks that we didn't jump across the cut
+            candidates = (diffs[:, :-1] * diffs[:, 1:] <= 0) & (np.abs(diffs[:, :-1] - diffs[:, 1:]) < 180)
+            
+            for k, (natal_pid, natal_lon, asp_name, target) in enumerate(pairs):
+                # DEBUG PRINT FOR SUN
+                if i == 0 and natal_pid == chart.SUN and asp_name == "Conjunción":
+                   print(f"DEBUG SUN CONJUNCTION SUN:")
+                   print(f"Natal: {natal_lon}, Target: {target}")
+                   print(f"Transit Lon [0]: {transit_lons[0]}")
+                   print(f"Diff [0]: {diffs[k, 0]}")
+                   print(f"Candidates found: {np.sum(candidates[k])}")
+                
+                day_indices = np.where(candidates[k])[0]
+                
+                for day_idx in day_indices:
+                    # 3. Refinement (Root Finding)
+                    # We know event is between day_idx and day_idx+1
+                    t0 = jds[day_idx]
+                    t1 = jds[day_idx+1]
                     
-                    for day_idx in day_indices:
-                        # 3. Refinement (Root Finding)
-                        # We know event is between day_idx and day_idx+1
-                        t0 = jds[day_idx]
-                        t1 = jds[day_idx+1]
+                    exact_time = self._find_precise_time(transit_pid, target, t0, t1)
+                    if exact_time:
+                        # Create Event
+                        dt = self._jd_to_datetime(exact_time)
                         
-                        exact_time = self._find_precise_time(transit_pid, target, t0, t1)
-                        if exact_time:
-                            # Create Event
-                            dt = self._jd_to_datetime(exact_time)
-                            
-                            # Filter out of range
-                            if not (start_date <= dt <= end_date):
-                                continue
-                                
-                            # Re-verify logic (sanity check)
-                            final_pos = swe.calc_ut(exact_time, transit_pid)[0][0]
-                            final_orb = abs(self._normalize_diff(final_pos, target))
+                        # Filter out of range
+                        if not (start_date <= dt <= end_date):
+                            continue
                             
-                            if final_orb > 0.1: # False positive check
-                                continue
-                                
-                            events.append(AstroEvent(
-                                fecha_utc=dt,
-                                tipo_evento=EventType.ASPECTO,
-                                descripcion=f"{PLANET_NAMES[transit_pid]} {asp_name} {PLANET_NAMES[natal_pid]} Natal",
-                                planeta1=PLANET_NAMES[transit_pid],
-                                planeta2=PLANET_NAMES[natal_pid],
-                                longitud1=final_pos,
-                                longitud2=natal_lon,
-                                tipo_aspecto=asp_name,
-                                orbe=final_orb,
-                                es_aplicativo=False, # Would need derivative check
-                                metadata={"method": "vectorized_poc"}
-                            ))
+                        # Re-verify logic (sanity check)
+                        final_pos = swe.calc_ut(exact_time, transit_pid)[0][0]
+                        final_orb = abs(self._normalize_diff(final_pos, target))
+                        
+                        if final_orb > 0.1: # False positive check
+                            continue
                             
+                        events.append(AstroEvent(
+                            fecha_utc=dt,
+                            tipo_evento=EventType.ASPECTO,
+                            descripcion=f"{PLANET_NAMES[transit_pid]} {asp_name} {PLANET_NAMES[natal_pid]} Natal",
+                            planeta1=PLANET_NAMES[transit_pid],
+                            planeta2=PLANET_NAMES[natal_pid],
+                            longitud1=final_pos,
+                            longitud2=natal_lon,
+                            tipo_aspecto=asp_name,
+                            orbe=final_orb,
+                            es_aplicativo=False, # Would need derivative check
+                            metadata={"method": "vectorized_poc"}
+                        ))
+                        
         return sorted(events, key=lambda x: x.fecha_utc)
 
     def _find_precise_time(self, pid, target_lon, jd_start, jd_end, steps=10):
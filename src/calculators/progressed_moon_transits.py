@@ -3,6 +3,7 @@ Módulo para calcular conjunciones entre la Luna progresada y planetas natales.
 Versión optimizada con algoritmo simplificado y validado astronómicamente.
 """
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from src.core import config
@@ -19,6 +20,10 @@ settings.aspects = [calc.CONJUNCTION]  # Solo conjunciones
 settings.default_orb = 2.0  # Orbe de 2° para Luna progresada
 settings.exact_orb = 0.001  # Aspecto exacto dentro de 0.001°
 
+# Tamaño máximo de la caché de Luna progresada: un año de pasos diarios,
+# el rango por defecto de calculate_all
+PROGRESSED_MOON_CACHE_SIZE = 366
+
 # Mapeo de IDs a nombres de planetas
 PLANET_NAMES = {
     chart.SUN: "Sol",
@@ -143,18 +148,41 @@ class ProgressedMoonTransitsCalculator:
                     'distance': 0,
                     'speed': 0
                 }
+        
+        # Caché LRU de posiciones de Luna progresada por instante (timestamp)
+        self.progressed_moon_cache: "OrderedDict[float, float]" = OrderedDict()
 
     def _calculate_progressed_moon_position(self, current_date: datetime) -> float:
         """
         Calcula la posición de la Luna progresada para una fecha específica utilizando
         el método ARMC 1 Naibod, que es el método utilizado por AstroSeek.
         
+        Las posiciones se guardan en caché por instante: calculate_all recorre el mismo
+        rango de días una vez por cada planeta natal. La caché se limita a
+        PROGRESSED_MOON_CACHE_SIZE entradas, descartando la menos usada.
+        
         Args:
             current_date: Fecha para la que calcular la Luna progresada
             
         Returns:
             Posición de la Luna progresada en grados absolutos (0-360)
         """
+        cache_key = current_date.timestamp()
+        cached = self.progressed_moon_cache.get(cache_key)
+        if cached is not None:
+            self.progressed_moon_cache.move_to_end(cache_key)
+            return cached
+        
+        position = self._compute_progressed_moon_position(current_date)
+        self.progressed_moon_cache[cache_key] = position
+        if len(self.progressed_moon_cache) > PROGRESSED_MOON_CACHE_SIZE:
+            self.progressed_moon_cache.popitem(last=False)
+        return position
+
+    def _compute_progressed_moon_position(self, current_date: datetime) -> float:
+        """
+        Cálculo sin caché de la Luna progresada (ver _calculate_progressed_moon_position).
+        """
         try:
             # Si la fecha es anterior o igual a la fecha de nacimiento, devolver la posición natal
             if current_date <= self.birth_date:
@@ -2,6 +2,19 @@
 Factory para crear calculadores de tránsitos según el método requerido.
 """
 
+def _points_from_arrays(natal_data):
+    """
+    Convierte natal_data en formato SoA ('names' + 'longitudes') al dict 'points'
+    que esperan los calculadores no vectorizados.
+    """
+    if 'points' in natal_data or 'longitudes' not in natal_data:
+        return natal_data
+    points = {
+        name: {'longitude': lon}
+        for name, lon in zip(natal_data['names'], natal_data['longitudes'].tolist())
+    }
+    return {**natal_data, 'points': points}
+
 class TransitsCalculatorFactory:
     @staticmethod
     def create_calculator(natal_data, calculator_type="standard", use_parallel=False, timezone_str="UTC"):
@@ -9,7 +22,8 @@ class TransitsCalculatorFactory:
         Crea un calculador de tránsitos según el método requerido.
         
         Args:
-            natal_data: Diccionario con los datos natales del usuario
+            natal_data: Diccionario con los datos natales del usuario ('points', o
+                'names' + 'longitudes' como arrays numpy)
             calculator_type: Tipo de calculador ("standard", "astronomical_v3", "astronomical_v4", "progressed_moon", o "immanuel")
             use_parallel: Si es True, usa procesamiento paralelo (solo para standard)
             timezone_str: La zona horaria a usar para los eventos generados (para Standard/Parallel).
@@ -18,6 +32,13 @@ class TransitsCalculatorFactory:
             Un calculador de tránsitos
         """
         # Nota: Se eliminaron las opciones "optimized", "astronomical", "astronomical_v2"
+        if calculator_type == "vectorized":
+            from .vectorized_transits_calculator import VectorizedTransitsCalculator
+            # Vectorized v1 es "stateless" respecto a timezone (devuelve UTC);
+            # acepta natal_data estándar o directamente los arrays 'names'/'longitudes'.
+            return VectorizedTransitsCalculator(natal_data)
+
+        natal_data = _points_from_arrays(natal_data)
         if calculator_type == "astronomical_v3":
             from .astronomical_transits_calculator_v3 import AstronomicalTransitsCalculatorV3
             # V3 maneja su propia zona horaria internamente desde natal_data
@@ -34,11 +55,6 @@ class TransitsCalculatorFactory:
             from .transits_immanuel import ImmanuelTransitsCalculator
             # Asumimos que este también necesita la zona horaria
             return ImmanuelTransitsCalculator(natal_data, timezone_str=timezone_str)
-        elif calculator_type == "vectorized":
-            from .vectorized_transits_calculator import VectorizedTransitsCalculator
-            # Vectorized v1 es "stateless" respecto a timezone (devuelve UTC), 
-            # pero acepta natal_data estándar.
-            return VectorizedTransitsCalculator(natal_data)
         else:  # standard (incluye paralelo)
             if use_parallel:
                 from .all_transits_parallel import ParallelTransitsCalculator
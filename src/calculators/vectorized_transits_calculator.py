@@ -72,18 +72,25 @@ class VectorizedTransitsCalculator:
         Initialize the Vectorized Calculator.
         
         Args:
-            natal_data: Dictionary containing natal chart data (points, location, etc.)
+            natal_data: Dictionary containing natal chart data (points, location, etc.).
+                May also come in SoA form: 'names' (array of str) + 'longitudes' (float64 array).
         """
         self.natal_data = natal_data
         self.natal_positions = {}
         
-        # Parse natal positions (support both "Sun" and "Sol" keys if unstable)
-        # Using the standard naming convention expected from API
-        for pname, data in natal_data.get('points', {}).items():
+        # SoA layout ('names' + 'longitudes' arrays) takes precedence over 'points'
+        if 'longitudes' in natal_data:
+            pairs = zip(natal_data['names'], natal_data['longitudes'].tolist())
+        else:
+            # Parse natal positions (support both "Sun" and "Sol" keys if unstable)
+            # Using the standard naming convention expected from API
+            pairs = ((pname, data['longitude']) for pname, data in natal_data.get('points', {}).items())
+
+        for pname, lon in pairs:
             # Standardize name to ID
             pid = self._get_planet_id(pname)
             if pid is not None:
-                self.natal_positions[pid] = data['longitude']
+                self.natal_positions[pid] = lon
                 
         logger.info(f"VectorizedTransitsCalculator initialized with {len(self.natal_positions)} natal points.")
 
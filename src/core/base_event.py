@@ -4,7 +4,7 @@ from typing import Optional, Dict, Any
 from zoneinfo import ZoneInfo
 from .constants import EventType, AstronomicalConstants
 
-@dataclass
+@dataclass(slots=True)
 class AstroEvent:
     """Clase base para eventos astronómicos"""
     fecha_utc: datetime
@@ -36,6 +36,15 @@ class AstroEvent:
     metadata: Dict[str, Any] = field(default_factory=dict)
     # Nueva clasificación de importancia (high, medium, low)
     relevance: str = "low"
+    # Posiciones formateadas (copia de metadata['posicion1'/'posicion2'] como atributo)
+    posicion1: Optional[str] = None
+    posicion2: Optional[str] = None
+    # Derivados en __post_init__ (declarados para que entren en __slots__)
+    fecha_local: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    signo1: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    signo2: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    grado1: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    grado2: Optional[float] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Inicialización posterior con validaciones y cálculos adicionales"""
@@ -53,6 +62,12 @@ class AstroEvent:
             tz_local = ZoneInfo("UTC")
             
         self.fecha_local = self.fecha_utc.astimezone(tz_local)
+
+        # Los calculadores guardan las posiciones formateadas en metadata
+        if self.posicion1 is None:
+            self.posicion1 = self.metadata.get('posicion1')
+        if self.posicion2 is None:
+            self.posicion2 = self.metadata.get('posicion2')
         
         # Para aspectos, calcular datos adicionales
         if self.tipo_evento == EventType.ASPECTO:
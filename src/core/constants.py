@@ -196,3 +196,17 @@ class AstronomicalConstants:
     def get_planet_id(cls, planet_name: str) -> int:
         """Obtiene el ID de Swiss Ephemeris para un planeta"""
         return cls.PLANETS[planet_name][0]
+
+# Mapeo de signos a su posición base (0-330), en inglés y en español
+SIGNOS_BASE_EN = {
+    'Aries': 0, 'Taurus': 30, 'Gemini': 60, 'Cancer': 90,
+    'Leo': 120, 'Virgo': 150, 'Libra': 180, 'Scorpio': 210,
+    'Sagittarius': 240, 'Capricorn': 270, 'Aquarius': 300, 'Pisces': 330
+}
+SIGNOS_BASE_ES = {
+    'Aries': 0, 'Tauro': 30, 'Géminis': 60, 'Cáncer': 90,
+    'Leo': 120, 'Virgo': 150, 'Libra': 180, 'Escorpio': 210,
+    'Sagitario': 240, 'Capricornio': 270, 'Acuario': 300, 'Piscis': 330
+}
+# Ambos idiomas en un solo dict (Aries, Leo, Virgo y Libra coinciden en los dos)
+SIGNOS_BASE = {**SIGNOS_BASE_EN, **SIGNOS_BASE_ES}
@@ -0,0 +1,86 @@
+"""
+Inicialización de Swiss Ephemeris para el proceso del microservicio.
+"""
+
+import os
+import threading
+from datetime import datetime, timezone
+import immanuel
+import swisseph as swe
+from immanuel.setup import settings
+
+# Directorio de archivos .se1 que Immanuel configura por defecto
+EPHE_PATH = os.path.join(os.path.dirname(immanuel.__file__), 'resources', 'ephemeris')
+
+# Swiss Ephemeris guarda el path por hilo, así que la marca también es por hilo
+_ephe_state = threading.local()
+
+def ensure_ephe_path() -> str:
+    """
+    Fija el path de efemérides una sola vez por hilo.
+
+    Llamarla de nuevo (por ejemplo, al reimportar un script en un proceso
+    largo) no vuelve a invocar swe.set_ephe_path, que cerraría los archivos
+    .se1 ya abiertos. El microservicio usa preload_ephemeris en su evento de
+    startup.
+
+    Returns:
+        Path de efemérides configurado
+    """
+    if not getattr(_ephe_state, 'path_set', False):
+        swe.set_ephe_path(EPHE_PATH)
+        _ephe_state.path_set = True
+    return EPHE_PATH
+
+def preload_ephemeris() -> int:
+    """
+    Fija el path de efemérides en el hilo actual y precarga los archivos .se1.
+
+    Swiss Ephemeris guarda su configuración por hilo, por lo que se vuelve a
+    aplicar el path de Immanuel en el hilo que atiende las peticiones. Luego se
+    pide al kernel que traiga los .se1 a la caché de páginas y se calcula una
+    posición por planeta para que Swiss Ephemeris abra los archivos y lea sus
+    tablas de segmentos antes de la primera petición.
+
+    Returns:
+        Cantidad de archivos .se1 precargados
+    """
+    settings.set_swe_filepath()
+
+    preloaded = 0
+    if os.path.isdir(EPHE_PATH) and hasattr(os, 'posix_fadvise'):
+        for filename in os.listdir(EPHE_PATH):
+            if not filename.endswith('.se1'):
+                continue
+            fd = os.open(os.path.join(EPHE_PATH, filename), os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                preloaded += 1
+            finally:
+                os.close(fd)
+
+    # J2000: primera lectura de los archivos de planetas y Luna
+    for planet_id in range(swe.SUN, swe.PLUTO + 1):
+        swe.calc_ut(2451545.0, planet_id)
+
+    return preloaded
+
+def warm_up_ephemeris(years: int = 30, years_after: int = 2) -> int:
+    """
+    Calcula todos los planetas una vez por año sobre un rango de `years` años
+    que termina en el año actual más years_after (ambos extremos incluidos).
+
+    Deja en memoria los segmentos de los archivos .se1 que usan las peticiones
+    habituales: cartas natales (años pasados) y años de calendario (el actual
+    y los siguientes).
+
+    Returns:
+        Cantidad de cálculos (planeta, fecha) realizados
+    """
+    last_year = datetime.now(timezone.utc).year + years_after
+    jds = [swe.julday(year, 1, 1, 0.0)
+           for year in range(last_year - years + 1, last_year + 1)]
+    for jd in jds:
+        for planet_id in range(swe.SUN, swe.PLUTO + 1):
+            swe.calc_ut(jd, planet_id)
+    return len(jds) * (swe.PLUTO - swe.SUN + 1)
@@ -4,6 +4,7 @@ import traceback
 import ephem
 import httpx
 import pytz
+from collections import OrderedDict
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from zoneinfo import ZoneInfo
@@ -11,6 +12,11 @@ from fastapi import HTTPException
 
 INTERPRETATION_SERVICE_URL = os.getenv("INTERPRETATION_SERVICE_URL", "http://127.0.0.1:8002")
 
+# In-process LRU of strict events keyed by the request JSON (birth data + year).
+# Interpretations are not cached: they are fetched on every request.
+STRICT_EVENTS_CACHE_SIZE = 16
+_strict_events_cache: "OrderedDict[str, list]" = OrderedDict()
+
 # Import internal modules (paths remain relative to root as python path includes root)
 from src.core.location import Location
 from src.calculators.natal_chart import calcular_carta_natal
@@ -19,7 +25,7 @@ from src.calculators.profections_calculator import ProfectionsCalculator
 from src.calculators.lunar_phases import LunarPhaseCalculator
 from src.calculators.eclipses import EclipseCalculator
 from src.core.base_event import AstroEvent
-from src.core.constants import EventType
+from src.core.constants import EventType, SIGNOS_BASE
 
 from src.api.schemas import (
     BirthDataRequest, 
@@ -41,17 +47,6 @@ def _convertir_a_grados_absolutos(signo: str, grado: float, desde_ingles: bool =
     """
     Convierte una posición zodiacal (signo y grado) a grados absolutos (0-360).
     """
-    # Mapeo de signos a su posición base (0-330)
-    SIGNOS_BASE = {
-        # Inglés
-        'Aries': 0, 'Taurus': 30, 'Gemini': 60, 'Cancer': 90,
-        'Leo': 120, 'Virgo': 150, 'Libra': 180, 'Scorpio': 210,
-        'Sagittarius': 240, 'Capricorn': 270, 'Aquarius': 300, 'Pisces': 330,
-        # Español
-        'Aries': 0, 'Tauro': 30, 'Géminis': 60, 'Cáncer': 90,
-        'Leo': 120, 'Virgo': 150, 'Libra': 180, 'Escorpio': 210,
-        'Sagitario': 240, 'Capricornio': 270, 'Acuario': 300, 'Piscis': 330
-    }
     return SIGNOS_BASE[signo] + grado
 
 def _parsear_posicion(posicion: str) -> float:
@@ -784,6 +779,127 @@ async def calculate_calendar_legacy(request: NatalDataRequest) -> CalculationRes
             detail=f"Error calculating personal calendar: {str(e)}"
         )
 
+def _compute_strict_events(request: BirthDataRequest) -> tuple:
+    """
+    Calculate the natal chart and every event of the year for the strict endpoint,
+    converted to AstroEventStrict (before the interpretation enrichment).
+
+    Returns:
+        (list of AstroEventStrict, True if every step succeeded; False when an optional
+        step such as the Astral Climate failed and the list is partial)
+    """
+    complete = True
+    # 1. Setup Location
+    location = Location(
+        lat=request.location.latitude,
+        lon=request.location.longitude,
+        name=request.location.name,
+        timezone=request.location.timezone,
+        elevation=25
+    )
+    try:
+        _ = ZoneInfo(location.timezone)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid timezone: {str(e)}")
+    
+    # 2. Calculate Natal Chart
+    birth_data = {
+        "hora_local": f"{request.birth_date}T{request.birth_time}:00",
+        "lat": request.location.latitude,
+        "lon": request.location.longitude,
+        "zona_horaria": request.location.timezone,
+        "lugar": request.location.name
+    }
+    natal_data = calcular_carta_natal(birth_data)
+    natal_data['name'] = request.name
+    
+    # 3. Calculate Events
+    start_date = datetime(request.year, 1, 1, tzinfo=pytz.UTC)
+    end_date = datetime(request.year + 1, 1, 1, tzinfo=pytz.UTC)
+    all_events = []
+    
+    # 3a. Transits
+    transits_calculator = TransitsCalculatorFactory.create_calculator(
+        natal_data, calculator_type="vectorized", use_parallel=False, timezone_str=location.timezone
+    )
+    all_events.extend(transits_calculator.calculate_all(start_date, end_date))
+    
+    # 3b. Progressed Moon
+    progressed_calculator = TransitsCalculatorFactory.create_calculator(
+        natal_data, calculator_type="progressed_moon"
+    )
+    all_events.extend(progressed_calculator.calculate_all(start_date, end_date))
+    
+    # 3c. Profections
+    profections_calculator = ProfectionsCalculator(natal_data)
+    all_events.extend(profections_calculator.calculate_profection_events(start_date, end_date))
+    
+    # 3d. Lunar Phases & Eclipses
+    observer = ephem.Observer()
+    observer.lat = str(location.lat)
+    observer.lon = str(location.lon)
+    observer.elevation = location.elevation
+    
+    lunar_calculator = LunarPhaseCalculator(observer, location.timezone, natal_data.get('houses'))
+    lunar_events = lunar_calculator.calculate_phases(start_date, end_date)
+    all_events.extend(lunar_events)
+    
+    eclipse_calculator = EclipseCalculator(observer, location.timezone, natal_data.get('houses'))
+    eclipse_events = eclipse_calculator.calculate_eclipses(start_date, end_date)
+    all_events.extend(eclipse_events)
+    
+    # 3e. Aspects for phases
+    aspect_events = _add_moon_phase_and_eclipse_aspects(
+        lunar_events, eclipse_events, natal_data, location.timezone
+    )
+    all_events.extend(aspect_events)
+    
+    # Sort
+    all_events.sort(key=lambda x: x.fecha_utc)
+
+    # --- NEW: Calculate House Transits (Astral Climate) ---
+    print("🪐 STRICT: Calculating House Transits (Astral Climate)...")
+    try:
+        from src.calculators.astronomical_transits_calculator_v4 import AstronomicalTransitsCalculatorV4
+        v4_calc = AstronomicalTransitsCalculatorV4(natal_data)
+        for m in range(1, 13):
+            month_date = datetime(request.year, m, 1, 12, 0, tzinfo=pytz.UTC)
+            state_event = v4_calc.calculate_house_transits_state(month_date)
+            if state_event:
+                all_events.append(state_event)
+        all_events.sort(key=lambda x: x.fecha_utc)
+        print("✅ STRICT: Added Astral Climate events.")
+    except Exception as e:
+        print(f"⚠️ STRICT: Error calculating Astral Climate: {e}")
+        complete = False
+    # --- END: House Transits ---
+    
+    # 4. CONVERT TO STRICT RESPONSE
+    return [convert_astro_event_to_strict_response(event) for event in all_events], complete
+
+def _strict_events(request: BirthDataRequest) -> tuple:
+    """
+    Strict events for a request, from the in-process cache when the same birth data
+    and year were already calculated.
+
+    Returns:
+        (list of AstroEventStrict copies safe to enrich, True if it came from the cache)
+    """
+    key = request.model_dump_json()
+    cached = _strict_events_cache.get(key)
+    from_cache = cached is not None
+    if from_cache:
+        _strict_events_cache.move_to_end(key)
+    else:
+        cached, complete = _compute_strict_events(request)
+        # A partial result (a step failed) is served once but not cached
+        if complete:
+            _strict_events_cache[key] = cached
+            if len(_strict_events_cache) > STRICT_EVENTS_CACHE_SIZE:
+                _strict_events_cache.popitem(last=False)
+    # Shallow copies: the enrichment only assigns interpretacion on each event
+    return [event.model_copy() for event in cached], from_cache
+
 async def calculate_calendar_dynamic_strict(request: BirthDataRequest) -> CalculationResponseStrict:
     """
     Strict version of Calculate Calendar.
@@ -794,92 +910,8 @@ async def calculate_calendar_dynamic_strict(request: BirthDataRequest) -> Calcul
     try:
         print(f"STRICT: Calculating personal calendar for {request.name}...")
         
-        # 1. Setup Location
-        location = Location(
-            lat=request.location.latitude,
-            lon=request.location.longitude,
-            name=request.location.name,
-            timezone=request.location.timezone,
-            elevation=25
-        )
-        try:
-            _ = ZoneInfo(location.timezone)
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Invalid timezone: {str(e)}")
-        
-        # 2. Calculate Natal Chart
-        birth_data = {
-            "hora_local": f"{request.birth_date}T{request.birth_time}:00",
-            "lat": request.location.latitude,
-            "lon": request.location.longitude,
-            "zona_horaria": request.location.timezone,
-            "lugar": request.location.name
-        }
-        natal_data = calcular_carta_natal(birth_data)
-        natal_data['name'] = request.name
-        
-        # 3. Calculate Events
-        start_date = datetime(request.year, 1, 1, tzinfo=pytz.UTC)
-        end_date = datetime(request.year + 1, 1, 1, tzinfo=pytz.UTC)
-        all_events = []
-        
-        # 3a. Transits
-        transits_calculator = TransitsCalculatorFactory.create_calculator(
-            natal_data, calculator_type="vectorized", use_parallel=False, timezone_str=location.timezone
-        )
-        all_events.extend(transits_calculator.calculate_all(start_date, end_date))
-        
-        # 3b. Progressed Moon
-        progressed_calculator = TransitsCalculatorFactory.create_calculator(
-            natal_data, calculator_type="progressed_moon"
-        )
-        all_events.extend(progressed_calculator.calculate_all(start_date, end_date))
-        
-        # 3c. Profections
-        profections_calculator = ProfectionsCalculator(natal_data)
-        all_events.extend(profections_calculator.calculate_profection_events(start_date, end_date))
-        
-        # 3d. Lunar Phases & Eclipses
-        observer = ephem.Observer()
-        observer.lat = str(location.lat)
-        observer.lon = str(location.lon)
-        observer.elevation = location.elevation
-        
-        lunar_calculator = LunarPhaseCalculator(observer, location.timezone, natal_data.get('houses'))
-        lunar_events = lunar_calculator.calculate_phases(start_date, end_date)
-        all_events.extend(lunar_events)
-        
-        eclipse_calculator = EclipseCalculator(observer, location.timezone, natal_data.get('houses'))
-        eclipse_events = eclipse_calculator.calculate_eclipses(start_date, end_date)
-        all_events.extend(eclipse_events)
-        
-        # 3e. Aspects for phases
-        aspect_events = _add_moon_phase_and_eclipse_aspects(
-            lunar_events, eclipse_events, natal_data, location.timezone
-        )
-        all_events.extend(aspect_events)
-        
-        # Sort
-        all_events.sort(key=lambda x: x.fecha_utc)
-
-        # --- NEW: Calculate House Transits (Astral Climate) ---
-        print("🪐 STRICT: Calculating House Transits (Astral Climate)...")
-        try:
-            from src.calculators.astronomical_transits_calculator_v4 import AstronomicalTransitsCalculatorV4
-            v4_calc = AstronomicalTransitsCalculatorV4(natal_data)
-            for m in range(1, 13):
-                month_date = datetime(request.year, m, 1, 12, 0, tzinfo=pytz.UTC)
-                state_event = v4_calc.calculate_house_transits_state(month_date)
-                if state_event:
-                    all_events.append(state_event)
-            all_events.sort(key=lambda x: x.fecha_utc)
-            print("✅ STRICT: Added Astral Climate events.")
-        except Exception as e:
-            print(f"⚠️ STRICT: Error calculating Astral Climate: {e}")
-        # --- END: House Transits ---
-        
-        # 4. CONVERT TO STRICT RESPONSE
-        response_events = [convert_astro_event_to_strict_response(event) for event in all_events]
+        # 1-4. Natal chart, events and strict conversion (cached per birth data and year)
+        response_events, from_cache = _strict_events(request)
 
         # 5. Interpretations (Enrichment)
         # Note: We must handle datetime serialization manually for the external service
@@ -926,7 +958,8 @@ async def calculate_calendar_dynamic_strict(request: BirthDataRequest) -> Calcul
             name=request.name,
             transits_count=len([e for e in response_events if 'Transito' in e.tipo_evento or 'Tránsito' in e.tipo_evento]),
             progressed_moon_count=len([e for e in response_events if e.tipo_evento == 'Luna Progresada']),
-            profections_count=len([e for e in response_events if e.tipo_evento == 'Profección Anual'])
+            profections_count=len([e for e in response_events if e.tipo_evento == 'Profección Anual']),
+            from_cache=from_cache
         )
 
     except Exception as e:
@@ -0,0 +1,71 @@
+import bisect
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List
+
+import numpy as np
+import swisseph as swe
+
+from src.utils.swe_batch import calc_many
+
+# Fases principales: elongación Luna-Sol en grados
+NEW_MOON = 0
+FIRST_QUARTER = 90
+FULL_MOON = 180
+LAST_QUARTER = 270
+
+
+def find_lunations(jd_start: float, jd_end: float,
+                   targets: Iterable[int] = (NEW_MOON, FIRST_QUARTER, FULL_MOON, LAST_QUARTER),
+                   step: float = 0.25) -> Dict[int, List[float]]:
+    """
+    Encuentra todas las fases lunares de un rango con un único barrido.
+
+    Calcula la elongación Luna-Sol en una grilla de `step` días, detecta los
+    cruces ascendentes de cada ángulo objetivo y refina cada raíz con Newton
+    usando las velocidades de Swiss Ephemeris.
+
+    Args:
+        jd_start: Día juliano inicial (UT)
+        jd_end: Día juliano final (UT)
+        targets: Ángulos de elongación a buscar
+        step: Paso de la grilla en días
+
+    Returns:
+        Dict ángulo -> lista ordenada de días julianos exactos
+    """
+    jds = np.arange(jd_start, jd_end + step, step)
+    sun = calc_many(jds, swe.SUN)[:, 0]
+    moon = calc_many(jds, swe.MOON)[:, 0]
+    elong = (moon - sun) % 360
+
+    lunations = {}
+    for target in targets:
+        # La elongación siempre crece: el cruce del objetivo es el paso de - a +
+        s = np.sin(np.radians(elong - target))
+        idx = np.where((s[:-1] < 0) & (s[1:] >= 0))[0]
+
+        roots = []
+        for i in idx:
+            # Semilla por interpolación lineal entre los dos puntos de la grilla
+            jd = jds[i] + step * s[i] / (s[i] - s[i + 1])
+            for _ in range(3):
+                sun_res = swe.calc_ut(jd, swe.SUN, swe.FLG_SPEED)[0]
+                moon_res = swe.calc_ut(jd, swe.MOON, swe.FLG_SPEED)[0]
+                err = (moon_res[0] - sun_res[0] - target + 180) % 360 - 180
+                jd -= err / (moon_res[3] - sun_res[3])
+            roots.append(float(jd))
+        lunations[target] = roots
+
+    return lunations
+
+
+def next_lunation(lunations: Dict[int, List[float]], target: int, jd: float) -> float:
+    """Devuelve la primera fase `target` posterior a `jd`."""
+    roots = lunations[target]
+    return roots[bisect.bisect_right(roots, jd)]
+
+
+def jd_to_datetime(jd: float) -> datetime:
+    """Convierte un día juliano (UT) a datetime UTC."""
+    year, month, day, hours = swe.revjul(jd, swe.GREG_CAL)
+    return datetime(year, month, day, tzinfo=timezone.utc) + timedelta(hours=hours)
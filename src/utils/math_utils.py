@@ -56,6 +56,12 @@ def calculate_planet_position(jd: float, planet_id: int, flags: int = None) -> D
         'speed': speed
     }
 
+SIGN_ABBR = ('Ari', 'Tau', 'Gem', 'Can', 'Leo', 'Vir', 'Lib', 'Sco', 'Sag', 'Cap', 'Aqu', 'Pis')
+
+def fmt_sign(deg: float) -> str:
+    """Formatea una longitud eclíptica como signo abreviado y grados (ej: 'Vir 12.83°')"""
+    return f"{SIGN_ABBR[int(deg / 30) % 12]} {deg % 30:.2f}°"
+
 def format_position(lon: float) -> str:
     """Formatea la longitud eclíptica"""
     from src.core.constants import AstronomicalConstants
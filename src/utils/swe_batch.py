@@ -0,0 +1,44 @@
+import numpy as np
+import swisseph as swe
+
+
+def calc_many(jds: np.ndarray, body: int, flag: int = 0) -> np.ndarray:
+    """
+    Calcula la posición de un mismo cuerpo para varios días julianos.
+
+    Args:
+        jds: Array de días julianos (UT)
+        body: ID del cuerpo en Swiss Ephemeris
+        flag: Flags de cálculo para swe.calc_ut
+
+    Returns:
+        Array (N, 6): longitud, latitud, distancia y sus velocidades
+    """
+    jds = np.asarray(jds, dtype=float)
+    out = np.empty((len(jds), 6))
+    for i, jd in enumerate(jds):
+        out[i] = swe.calc_ut(jd, body, flag)[0]
+    return out
+
+
+def calc_bodies(jd: float, bodies: np.ndarray, flag: int = 0) -> np.ndarray:
+    """
+    Calcula varios cuerpos para un mismo día juliano.
+
+    Los IDs se recorren en el orden recibido y las filas salen en ese mismo
+    orden; pasarlos en orden creciente aprovecha la localidad de los archivos
+    de efemérides (planetas contiguos comparten archivo .se1).
+
+    Args:
+        jd: Día juliano (UT)
+        bodies: Array de IDs de cuerpos en Swiss Ephemeris
+        flag: Flags de cálculo para swe.calc_ut
+
+    Returns:
+        Array (N, 6): longitud, latitud, distancia y sus velocidades
+    """
+    bodies = np.asarray(bodies, dtype=int)
+    out = np.empty((len(bodies), 6))
+    for i, body in enumerate(bodies):
+        out[i] = swe.calc_ut(jd, int(body), flag)[0]
+    return out
@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta, timezone
 from typing import Callable, Tuple
+import numpy as np
 import swisseph as swe
 import warnings
 import pytz
@@ -50,6 +51,24 @@ def julian_day(date: datetime) -> float:
     
     return jd_tt
 
+def to_jd(dt: datetime) -> float:
+    """
+    Convierte datetime a día juliano UT (sin Delta T, a diferencia de julian_day()).
+    Las fechas naive se asumen en UTC.
+    """
+    if dt.tzinfo is not None and dt.tzinfo is not timezone.utc:
+        dt = dt.astimezone(timezone.utc)
+    return swe.julday(dt.year, dt.month, dt.day, dt.hour + dt.minute/60.0 + dt.second/3600.0)
+
+def jds_from_dt64(dt64_utc: np.ndarray) -> np.ndarray:
+    """
+    Convierte un array de datetime64 (UTC) a días julianos (UT) sin llamar a swe.julday.
+
+    A diferencia de julian_day(), no aplica Delta T.
+    """
+    ns = np.asarray(dt64_utc, dtype='datetime64[ns]').astype('int64')
+    return ns / 86_400_000_000_000.0 + 2440587.5
+
 def binary_search_exact_time(
     start_date: datetime,
     end_date: datetime,
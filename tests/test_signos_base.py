@@ -0,0 +1,26 @@
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.constants import SIGNOS_BASE, SIGNOS_BASE_EN, SIGNOS_BASE_ES
+from src.services.calendar_service import _convertir_a_grados_absolutos
+
+def test_signos_base_en_y_es_coinciden():
+    # Los doce signos en cada idioma, en el mismo orden y con la misma base
+    assert list(SIGNOS_BASE_EN.values()) == list(range(0, 360, 30))
+    assert list(SIGNOS_BASE_ES.values()) == list(range(0, 360, 30))
+
+    # Los nombres compartidos entre idiomas tienen la misma base
+    for signo in ('Aries', 'Leo', 'Virgo', 'Libra'):
+        assert SIGNOS_BASE_EN[signo] == SIGNOS_BASE_ES[signo]
+    assert SIGNOS_BASE['Cancer'] == SIGNOS_BASE['Cáncer'] == 90
+
+    # 12 + 12 nombres, 4 repetidos
+    assert len(SIGNOS_BASE) == 20
+
+def test_convertir_a_grados_absolutos():
+    assert _convertir_a_grados_absolutos('Leo', 15.5) == 135.5
+    assert _convertir_a_grados_absolutos('Piscis', 29.0) == 359.0
+    assert _convertir_a_grados_absolutos('Pisces', 29.0) == 359.0
@@ -0,0 +1,60 @@
+"""
+Tránsitos de un año completo compartidos por los generadores de CSV.
+
+generate_final_csv.py y generate_missing_rag_csv.py calculan los mismos eventos
+para la misma carta natal. El resultado de calculate_all se guarda en un pickle
+en .cache_transits/ y cualquiera de los dos scripts lo reutiliza sin volver a
+correr el motor vectorial.
+"""
+import hashlib
+import os
+import pickle
+from datetime import datetime
+from functools import lru_cache
+from typing import List
+from zoneinfo import ZoneInfo
+
+from natal_cache import compute_natal, NATAL_FLAGS
+from src.core.ephemeris import ensure_ephe_path
+from src.calculators.transits_calculator_factory import TransitsCalculatorFactory
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache_transits')
+# Subir cuando cambien los campos de AstroEvent (invalida los pickles viejos)
+CACHE_VERSION = 3
+
+@lru_cache(maxsize=1)
+def _year_events(birth_dt_local: datetime, lat: float, lon: float, year: int) -> tuple:
+    natal_key = f"v{CACHE_VERSION}|{birth_dt_local.isoformat()}|{birth_dt_local.tzinfo}|{lat}|{lon}|{ensure_ephe_path()}|{NATAL_FLAGS}"
+    digest = hashlib.sha1(natal_key.encode('utf-8')).hexdigest()[:16]
+    path = os.path.join(CACHE_DIR, f"{year}_{digest}.pkl")
+
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            return tuple(pickle.load(f))
+
+    natal_data = compute_natal(birth_dt_local, lat, lon)
+    calc = TransitsCalculatorFactory.create_calculator(natal_data, calculator_type="vectorized")
+    start_date = datetime(year, 1, 1, tzinfo=ZoneInfo("UTC"))
+    end_date = datetime(year, 12, 31, 23, 59, tzinfo=ZoneInfo("UTC"))
+    events = calc.calculate_all(start_date, end_date)
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(path, 'wb') as f:
+        pickle.dump(events, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return tuple(events)
+
+def compute_year_events(birth_dt_local: datetime, lat: float, lon: float, year: int) -> List:
+    """
+    Devuelve los eventos de tránsito (motor vectorial) del año para una carta natal.
+
+    Args:
+        birth_dt_local: Fecha y hora de nacimiento con zona horaria
+        lat: Latitud del lugar de nacimiento
+        lon: Longitud del lugar de nacimiento
+        year: Año a calcular (1 ene 00:00 a 31 dic 23:59 UTC)
+
+    Returns:
+        Lista de AstroEvent
+    """
+    return list(_year_events(birth_dt_local, lat, lon, year))